@@ -1,117 +1,304 @@
 """
 Dependency Injection Container — bootstrap wiring of all concrete implementations.
 
-Pure Python, no FastAPI imports. All infrastructure is instantiated here
+Pure Python, no FastAPI imports. All infrastructure is declared here
 and wired into application-layer managers.
 
-Configuration:
+Every service is a cached property: it is built on first access and reused
+afterwards, so a worker only pays the init cost of the services its routes
+actually depend on (e.g. the REST-only `/mistakes` path never touches STT/TTS).
+
+Configuration (default `Container`):
 - LLM: Groq (ultra-fast Llama inference)
 - STT: Azure Speech-to-Text (cloud STT)
 - TTS: Azure Speech Service (neural voices)
+
+Alternative LLM backends are subclasses that override `_make_llm()` only;
+`create_container()` picks one from the LLM_BACKEND env var
+("groq" | "gemini" | "ollama").
 """
-from application.ConversationManager import ConversationManager
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
+
 from application.GrammarManager import GrammarManager
 from application.WorldStateManager import WorldStateManager
 from application.ReviewScheduler import ReviewScheduler
 from application.DialogueOrchestrator import DialogueOrchestrator
 
-from infrastructures.GroqLLM import GroqLLM
-from infrastructures.AzureSTT import AzureSTT
-from infrastructures.AzureTTS import AzureTTS
-from infrastructures.repos.WorldStateRepo import RedisWorldStateRepository
-from infrastructures.repos.MistakeRepo import PostgresMistakeRepository
-from infrastructures.repos.NPCRepo import PostgresNPCRepository
-from infrastructures.repos.PlayerProfileRepo import InMemoryPlayerProfileRepository
-from infrastructures.events import EventBus
+logger = logging.getLogger(__name__)
+
+# Infrastructure modules pull in heavy third-party SDKs (Azure Speech, Groq,
+# asyncpg, redis). They are imported inside the properties below so that a
+# worker only loads the SDKs it actually uses.
+if TYPE_CHECKING:
+    import httpx
+
+    from domain.interfaces.ILargeLanguageModel import ILargeLanguageModel
+    from domain.interfaces.ISpeechToText import ISpeechToText
+    from domain.interfaces.ITextToSpeech import ITextToSpeech
+    from infrastructures.repos.WorldStateRepo import RedisWorldStateRepository
+    from infrastructures.repos.BufferedMistakeRepo import BufferedMistakeRepository
+    from infrastructures.repos.NPCRepo import PostgresNPCRepository
+    from infrastructures.repos.PlayerProfileRepo import InMemoryPlayerProfileRepository
+    from infrastructures.events import EventBus
 
 
 class Container:
+    """
+    Process-wide singleton per class: every `Container()` (or subclass) call
+    returns that class's one instance, so re-imports (uvicorn --reload, test
+    fixtures) never build services twice.
+    """
+
+    _instance: Optional["Container"] = None
+
+    def __new__(cls):
+        # Looked up in the class's own __dict__ so each backend subclass gets
+        # its own instance rather than inheriting whichever was built first
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
+
     def __init__(self):
-        try:
-            # ── Infrastructure: Event Bus ────────────────────────────────
-            self.event_bus = EventBus()
-            print("[Container] Event bus initialized")
-            
-            # ── Infrastructure: AI services ──────────────────────────────
-            # LLM: Groq (ultra-fast Llama inference)
-            print("[Container] Initializing Groq LLM...")
-            self.llm_service = GroqLLM()
-            print("[Container] ✓ Groq LLM initialized")
-            
-            # STT: Azure Speech-to-Text (cloud STT)
-            print("[Container] Initializing Azure STT...")
-            self.stt_service = AzureSTT()
-            print("[Container] ✓ Azure STT initialized")
-            
-            # TTS: Azure Speech Service (fast, high-quality neural voices)
-            print("[Container] Initializing Azure TTS...")
-            self.tts_service = AzureTTS()
-            print("[Container] ✓ Azure TTS initialized")
-
-            # ── Infrastructure: Repositories ─────────────────────────────
-            print("[Container] Initializing Redis repository...")
-            self.world_state_repo = RedisWorldStateRepository()
-            print("[Container] ✓ Redis repository initialized")
-            
-            print("[Container] Initializing PostgreSQL repositories...")
-            self.mistake_repo = PostgresMistakeRepository()
-            self.npc_repo = PostgresNPCRepository()
-            self.player_profile_repo = InMemoryPlayerProfileRepository()
-            print("[Container] ✓ PostgreSQL repositories initialized")
-
-            # ── Application: Managers (DI injected) ──────────────────────
-            self.conversation_manager = ConversationManager(
-                world_state_repo=self.world_state_repo,
-                mistake_repo=self.mistake_repo,
-                npc_repo=self.npc_repo,
-                player_profile_repo=self.player_profile_repo,
-                stt_service=self.stt_service,
-                tts_service=self.tts_service,
-                llm_service=self.llm_service,
-            )
-
-            self.grammar_manager = GrammarManager(
-                llm_service=self.llm_service,
-                mistake_repo=self.mistake_repo,
-            )
-
-            self.world_state_manager = WorldStateManager(
-                world_state_repo=self.world_state_repo,
-            )
-
-            self.review_scheduler = ReviewScheduler(
-                llm_service=self.llm_service,
-                mistake_repo=self.mistake_repo,
-            )
-            
-            # ── Application: DialogueOrchestrator (Main Workflow) ────────
-            # Implements the STT → Grammar + LLM → TTS workflow
-            async def event_callback(event: dict):
-                """Callback for broadcasting events to the event bus."""
-                await self.event_bus.publish(
-                    topic=event.get("type", "unknown"),
-                    event_type=event.get("type"),
-                    data=event.get("data", {}),
-                    metadata={
-                        "player_id": event.get("player_id"),
-                        "timestamp": event.get("timestamp"),
-                    },
-                )
-            
-            self.dialogue_orchestrator = DialogueOrchestrator(
-                world_state_repo=self.world_state_repo,
-                mistake_repo=self.mistake_repo,
-                npc_repo=self.npc_repo,
-                player_profile_repo=self.player_profile_repo,
-                stt_service=self.stt_service,
-                tts_service=self.tts_service,
-                llm_service=self.llm_service,
-                event_callback=event_callback,
-            )
-            
-            print("[Container] ✅ All services initialized successfully")
-        except Exception as e:
-            print(f"[Container] ❌ INITIALIZATION FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
\ No newline at end of file
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+        logger.info("[Container] Created (services are initialized lazily on first use)")
+
+    # ── Infrastructure: Event Bus ────────────────────────────────────────
+    @cached_property
+    def event_bus(self) -> EventBus:
+        # EVENT_BUS=redis also records events to Redis Streams (batched XADD)
+        if os.environ.get("EVENT_BUS", "memory").lower() == "redis":
+            from infrastructures.events import RedisEventBus
+            from infrastructures.redis import get_redis_client
+            bus = RedisEventBus(get_redis_client())
+        else:
+            from infrastructures.events import EventBus
+            bus = EventBus()
+        logger.info("[Container] Event bus initialized: %s", type(bus).__name__)
+        return bus
+
+    # ── Infrastructure: Inference thread pool ───────────────────────────
+    @cached_property
+    def inference_pool(self) -> ThreadPoolExecutor:
+        # Blocking STT/TTS SDK calls run here instead of the loop's default
+        # executor, so they never queue behind unrelated blocking work.
+        return ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4,
+            thread_name_prefix="inference",
+        )
+
+    # ── Infrastructure: Shared HTTP client ───────────────────────────────
+    @cached_property
+    def http_client(self) -> httpx.AsyncClient:
+        # One pooled client for every HTTP-based provider: keep-alive and
+        # HTTP/2 multiplexing mean TLS is set up once, not once per call.
+        # TCP_NODELAY so token-sized stream writes are never held back by Nagle.
+        import socket
+        import httpx
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+        )
+        return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(30.0))
+
+    # ── Infrastructure: AI service factories (override in subclasses) ────
+    def _make_llm(self) -> ILargeLanguageModel:
+        # LLM: Groq (ultra-fast Llama inference)
+        from infrastructures.GroqLLM import GroqLLM
+        return GroqLLM(http_client=self.http_client)
+
+    def _make_stt(self) -> ISpeechToText:
+        # STT: Azure Speech-to-Text (cloud STT)
+        from infrastructures.AzureSTT import AzureSTT
+        return AzureSTT(executor=self.inference_pool)
+
+    def _make_tts(self) -> ITextToSpeech:
+        # TTS: Azure Speech Service (fast, high-quality neural voices)
+        from infrastructures.AzureTTS import AzureTTS
+        return AzureTTS(executor=self.inference_pool)
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+    async def shutdown(self) -> None:
+        """
+        Drain background work and release pooled resources. Only services that
+        were actually built are touched (cached properties live in __dict__).
+        """
+        built = self.__dict__
+        if "dialogue_orchestrator" in built:
+            await self.dialogue_orchestrator.shutdown()
+        if "world_state_manager" in built:
+            await self.world_state_manager.shutdown()
+        if "event_bus" in built:
+            # After the managers above, which may still publish while draining
+            await self.event_bus.shutdown()
+        if "mistake_repo" in built:
+            # After the orchestrator, whose grammar workers may still log mistakes
+            await self.mistake_repo.shutdown()
+        if "http_client" in built:
+            await self.http_client.aclose()
+        if "inference_pool" in built:
+            self.inference_pool.shutdown(wait=False)
+        logger.info("[Container] Shut down")
+
+    # ── Infrastructure: AI services ──────────────────────────────────────
+    async def warm_up(self) -> None:
+        """
+        Build the AI services and send each one tiny request, so the first
+        real turn does not pay for TLS setup, model loading or provider cold start.
+        Failures are logged and ignored; the services stay usable either way.
+        """
+        silence = bytes(3200)  # 100 ms of 16 kHz mono pcm_s16le
+        probes = {
+            "LLM": self.llm_service.complete('Reply with the JSON object {"ok": true}.', "ping"),
+            "STT": self.stt_service.transcribe(silence),
+            "TTS": self.tts_service.synthesize("Hi."),
+        }
+        results = await asyncio.gather(*probes.values(), return_exceptions=True)
+        for name, result in zip(probes, results):
+            if isinstance(result, Exception):
+                logger.warning("[Container] %s warm-up failed: %s", name, result)
+            else:
+                logger.info("[Container] ✓ %s warmed up", name)
+
+    @cached_property
+    def llm_service(self) -> ILargeLanguageModel:
+        logger.info("[Container] Initializing LLM...")
+        service = self._make_llm()
+        logger.info("[Container] ✓ LLM initialized: %s", type(service).__name__)
+        return service
+
+    @cached_property
+    def stt_service(self) -> ISpeechToText:
+        logger.info("[Container] Initializing STT...")
+        service = self._make_stt()
+        logger.info("[Container] ✓ STT initialized: %s", type(service).__name__)
+        return service
+
+    @cached_property
+    def tts_service(self) -> ITextToSpeech:
+        logger.info("[Container] Initializing TTS...")
+        service = self._make_tts()
+        logger.info("[Container] ✓ TTS initialized: %s", type(service).__name__)
+        return service
+
+    # ── Infrastructure: Repositories ─────────────────────────────────────
+    @cached_property
+    def world_state_repo(self) -> RedisWorldStateRepository:
+        from infrastructures.repos.WorldStateRepo import RedisWorldStateRepository
+        logger.info("[Container] Initializing Redis repository...")
+        repo = RedisWorldStateRepository()
+        logger.info("[Container] ✓ Redis repository initialized")
+        return repo
+
+    @cached_property
+    def mistake_repo(self) -> BufferedMistakeRepository:
+        from infrastructures.repos.BufferedMistakeRepo import BufferedMistakeRepository
+        from infrastructures.repos.CachedMistakeRepo import CachedMistakeRepository
+        from infrastructures.repos.MistakeRepo import PostgresMistakeRepository
+        # Writes are batched off the request path; the cache drops a player's
+        # aggregates once their batch has landed
+        return BufferedMistakeRepository(CachedMistakeRepository(PostgresMistakeRepository()))
+
+    @cached_property
+    def npc_repo(self) -> PostgresNPCRepository:
+        from infrastructures.repos.NPCRepo import PostgresNPCRepository
+        return PostgresNPCRepository()
+
+    @cached_property
+    def player_profile_repo(self) -> InMemoryPlayerProfileRepository:
+        from infrastructures.repos.PlayerProfileRepo import InMemoryPlayerProfileRepository
+        return InMemoryPlayerProfileRepository()
+
+    # ── Application: Managers (DI injected) ──────────────────────────────
+    @cached_property
+    def grammar_manager(self) -> GrammarManager:
+        return GrammarManager(
+            llm_service=self.llm_service,
+            mistake_repo=self.mistake_repo,
+        )
+
+    @cached_property
+    def world_state_manager(self) -> WorldStateManager:
+        return WorldStateManager(
+            world_state_repo=self.world_state_repo,
+        )
+
+    @cached_property
+    def review_scheduler(self) -> ReviewScheduler:
+        return ReviewScheduler(
+            llm_service=self.llm_service,
+            mistake_repo=self.mistake_repo,
+        )
+
+    # ── Application: DialogueOrchestrator (Main Workflow) ────────────────
+    _EVENT_METADATA_KEYS = ("player_id", "timestamp")
+
+    async def _broadcast_event(self, event: dict) -> None:
+        """Callback for broadcasting orchestrator events to the event bus."""
+        event_type = event.get("type")
+        await self.event_bus.publish(
+            topic=event_type or "unknown",
+            event_type=event_type,
+            data=event.get("data", {}),
+            metadata={key: event.get(key) for key in self._EVENT_METADATA_KEYS},
+        )
+
+    @cached_property
+    def dialogue_orchestrator(self) -> DialogueOrchestrator:
+        # Implements the STT → Grammar + LLM → TTS workflow
+        return DialogueOrchestrator(
+            world_state_repo=self.world_state_repo,
+            mistake_repo=self.mistake_repo,
+            npc_repo=self.npc_repo,
+            player_profile_repo=self.player_profile_repo,
+            stt_service=self.stt_service,
+            tts_service=self.tts_service,
+            llm_service=self.llm_service,
+            event_callback=self._broadcast_event,
+        )
+
+
+class GeminiContainer(Container):
+    """Google Gemini for LLM; STT/TTS stay on Azure."""
+
+    def _make_llm(self) -> ILargeLanguageModel:
+        from infrastructures.GeminiLLM import GeminiLLM
+        return GeminiLLM()
+
+
+class OllamaContainer(Container):
+    """Local Ollama for LLM (see SWITCH_TO_OLLAMA.md); STT/TTS stay on Azure."""
+
+    def _make_llm(self) -> ILargeLanguageModel:
+        from infrastructures.LLM import OllamaLLM
+        return OllamaLLM(http_client=self.http_client)
+
+
+_CONTAINERS_BY_BACKEND = {
+    "groq": Container,
+    "gemini": GeminiContainer,
+    "ollama": OllamaContainer,
+}
+
+
+def create_container() -> Container:
+    """Return the container for the LLM_BACKEND env var (default: groq)."""
+    backend = os.environ.get("LLM_BACKEND", "groq").lower()
+    try:
+        container_cls = _CONTAINERS_BY_BACKEND[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown LLM_BACKEND '{backend}'. "
+            f"Expected one of: {', '.join(_CONTAINERS_BY_BACKEND)}"
+        )
+    return container_cls()
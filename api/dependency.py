@@ -5,11 +5,12 @@ This module provides dependency injection functions for FastAPI routes.
 All dependencies are stored in app.state.container and injected via Depends().
 API routers MUST only import from this file — never directly from application or infrastructure.
 """
+import operator
+
 from fastapi import Depends
 from starlette.requests import HTTPConnection
 from typing import Annotated, Callable
 
-from application.ConversationManager import ConversationManager
 from application.GrammarManager import GrammarManager
 from application.WorldStateManager import WorldStateManager
 from application.ReviewScheduler import ReviewScheduler
@@ -27,18 +28,19 @@ def from_container(attr: str) -> Callable:
     Works with both HTTP (Request) and WebSocket endpoints.
     FastAPI automatically injects the appropriate type.
     """
+    # Resolved once per dependency, not per request; attrgetter walks the
+    # dotted path in C.
+    getter = operator.attrgetter(f"app.state.container.{attr}")
+
     def dep(conn: HTTPConnection):
         # conn can be either Request or WebSocket — both inherit from HTTPConnection
         # Both have .app.state attribute
-        result = getattr(conn.app.state.container, attr)
-        print(f"[Dependency] Injected {attr}")
-        return result
-    
+        return getter(conn)
+
     return dep
 
 
 # ── Manager Dependencies ──────────────────────────────────────────────────────
-ConversationManagerDep = Annotated[ConversationManager, Depends(from_container("conversation_manager"))]
 GrammarManagerDep = Annotated[GrammarManager, Depends(from_container("grammar_manager"))]
 WorldStateManagerDep = Annotated[WorldStateManager, Depends(from_container("world_state_manager"))]
 ReviewSchedulerDep = Annotated[ReviewScheduler, Depends(from_container("review_scheduler"))]
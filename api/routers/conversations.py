@@ -17,38 +17,186 @@ Implements the STT → Grammar + LLM → TTS workflow from the system design:
   3. Real-time event notifications via WebSocket
 """
 import asyncio
-import json
-from typing import Dict
+import logging
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional, Union
 
+import msgspec
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Request
-from api.dependency import ConversationManagerDep, GrammarManagerDep, DialogueOrchestratorDep
+from api.dependency import GrammarManagerDep, DialogueOrchestratorDep
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Store active WebSocket connections for event broadcasting
-_active_connections: Dict[str, WebSocket] = {}
 
+# ── Client → Server control frames ───────────────────────────────────────────
+# Tagged on the "type" field; decoded straight into typed structs.
+
+class EndUtterance(msgspec.Struct, tag="end_utterance"):
+    pass
+
+
+class StartUtterance(msgspec.Struct, tag="start_utterance"):
+    # Optional audio format handshake; defaults match what the STT expects
+    encoding: str = "pcm_s16le"
+    sample_rate: int = 16000
+    channels: int = 1
+
+
+class StopUtterance(msgspec.Struct, tag="stop_utterance"):
+    pass
+
+
+ControlMessage = Union[EndUtterance, StartUtterance, StopUtterance]
+
+# The only raw audio format the STT services accept (Unity PCM16 @ 16kHz mono)
+_SUPPORTED_AUDIO_FORMAT = ("pcm_s16le", 16000, 1)
+
+_control_decoder = msgspec.json.Decoder(ControlMessage)
+
+
+def _decode_control(text: str) -> Optional[ControlMessage]:
+    """Decode a control frame; unknown or malformed frames are ignored (None)."""
+    try:
+        return _control_decoder.decode(text)
+    except msgspec.DecodeError as e:
+        logger.debug("[WebSocket] Ignoring control frame: %s", e)
+        return None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a control/metadata frame for websocket.send_text (orjson is C-backed)."""
+    return orjson.dumps(obj).decode()
 
-async def event_broadcaster(event: dict) -> None:
+
+# Constant server → client frames, serialized once at import
+_TURN_COMPLETE = _dumps({"type": "turn_complete"})
+
+
+class _AudioFrameCoalescer:
     """
-    Callback for broadcasting events to Unity clients via WebSocket.
-    Called by the DialogueOrchestrator when events occur (e.g., grammar corrections).
+    Merges small headerless audio chunks into fewer binary WebSocket frames.
+
+    Each send_bytes is a separate WS frame and a transport write, so tiny chunks
+    are batched until MAX_BYTES or MAX_DELAY_SECONDS (whichever comes first).
+    Chunks that carry their own container header (e.g. a per-sentence RIFF/WAV
+    from Azure TTS) are always sent as their own frame so Unity can decode them.
     """
-    player_id = event.get("player_id")
-    if player_id and player_id in _active_connections:
-        websocket = _active_connections[player_id]
-        try:
-            await websocket.send_text(json.dumps(event))
-        except Exception as e:
-            print(f"[WebSocket] Failed to broadcast event to {player_id}: {e}")
+
+    MAX_BYTES = 16 * 1024
+    MAX_DELAY_SECONDS = 0.02
+    _SELF_CONTAINED_PREFIXES = (b"RIFF", b"ID3")
+
+    def __init__(self, send_bytes: Callable[[bytes], Awaitable[None]]):
+        self._send_bytes = send_bytes
+        self._pending = bytearray()
+        # Armed by the first pending byte, so a partial frame goes out after
+        # MAX_DELAY_SECONDS even if the producer goes quiet (e.g. mid-sentence LLM)
+        self._timer: Optional[asyncio.Task] = None
+        # The timer sends from its own task; keep frames in order
+        self._send_lock = asyncio.Lock()
+
+    async def add(self, chunk: bytes) -> None:
+        if chunk.startswith(self._SELF_CONTAINED_PREFIXES):
+            await self.flush()
+            async with self._send_lock:
+                await self._send_bytes(chunk)
+            return
+
+        self._pending += chunk
+        if len(self._pending) >= self.MAX_BYTES:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+    async def flush(self) -> None:
+        self.cancel()
+        await self._send_pending()
+
+    def cancel(self) -> None:
+        """Disarm the delay timer without sending (e.g. when the turn is interrupted)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self.MAX_DELAY_SECONDS)
+        # Cleared before sending so flush() never cancels a send in progress
+        self._timer = None
+        await self._send_pending()
+
+    async def _send_pending(self) -> None:
+        async with self._send_lock:
+            if self._pending:
+                data = bytes(self._pending)
+                self._pending.clear()
+                await self._send_bytes(data)
+
+
+class _UtteranceStream:
+    """
+    Queue-backed audio stream for one utterance.
+
+    The WebSocket reader pushes frames as they arrive while the orchestrator
+    consumes them concurrently, so STT can start before the player stops
+    speaking and the utterance is never joined into an extra buffer here.
+    """
+
+    _END = None
+
+    def __init__(self):
+        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+
+    def put(self, frame: bytes) -> None:
+        self._queue.put_nowait(frame)
+
+    def close(self) -> None:
+        self._queue.put_nowait(self._END)
+
+    async def frames(self) -> AsyncGenerator[bytes, None]:
+        while (frame := await self._queue.get()) is not self._END:
+            if self._queue.empty():
+                yield frame
+                continue
+            # Frames that queued up while STT was busy go out as one chunk:
+            # one wakeup per batch instead of one per frame
+            batch = bytearray(frame)
+            while not self._queue.empty():
+                frame = self._queue.get_nowait()
+                if frame is self._END:
+                    yield bytes(batch)
+                    return
+                batch += frame
+            yield bytes(batch)
+
+
+async def _collect_turn(
+    orchestrator, player_id: str, npc_id: str, stream: _UtteranceStream
+) -> tuple[list[bytes], list[dict]]:
+    """Run one turn, buffering audio and metadata separately to ensure proper ordering."""
+    audio_chunks: list[bytes] = []
+    metadata_events: list[dict] = []
+    async for item in orchestrator.process_streaming_conversation(
+        player_id=player_id,
+        npc_id=npc_id,
+        audio_stream=stream.frames(),
+    ):
+        # Check if it's audio (bytes) or metadata (dict)
+        if isinstance(item, bytes):
+            audio_chunks.append(item)
+        elif item.get("type") != "partial_transcription":
+            # Interim captions are stale once the turn is replayed in one go
+            metadata_events.append(item)
+    return audio_chunks, metadata_events
 
 
 @router.websocket("/ws/test")
 async def test_websocket(websocket: WebSocket):
     """Simple test WebSocket without dependencies."""
-    print("[Test WS] Connection attempt")
+    logger.debug("[Test WS] Connection attempt")
     await websocket.accept()
-    print("[Test WS] Connection accepted")
+    logger.debug("[Test WS] Connection accepted")
     await websocket.send_text("Hello from server!")
     await websocket.close()
 
@@ -75,7 +223,6 @@ async def conversation_websocket(
     Client → Server:
       - Binary frames: Raw audio bytes (PCM 16kHz mono)
       - JSON text: {"type": "end_utterance"} to signal speaking is done
-      - JSON text: {"type": "streaming", "enabled": true} for streaming mode
 
     Server → Client:
       - Binary frames: MP3/WAV audio chunks for NPC voice
@@ -86,14 +233,11 @@ async def conversation_websocket(
     # Manually get orchestrator from container
     orchestrator = websocket.app.state.container.dialogue_orchestrator
     
-    print(f"[WebSocket] Connection attempt from player_id={player_id}, npc_id={npc_id}")
-    print(f"[WebSocket] Orchestrator: {orchestrator}")
+    logger.debug("[WebSocket] Connection attempt from player_id=%s, npc_id=%s", player_id, npc_id)
     
     await websocket.accept()
-    print(f"[WebSocket] Connection accepted for player_id={player_id}")
-    
-    # Register connection for event broadcasting
-    _active_connections[player_id] = websocket
+    logger.info("[WebSocket] Connection accepted for player_id=%s", player_id)
+
 
     # Subscribe to event bus to forward grammar_correction events over this WebSocket
     event_bus = websocket.app.state.container.event_bus
@@ -102,115 +246,102 @@ async def conversation_websocket(
         if event.metadata.get("player_id") != player_id:
             return
         try:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(_dumps({
                 "type": "grammar_correction",
                 "player_id": player_id,
                 "data": event.data,
                 "timestamp": event.timestamp.isoformat() if event.timestamp else None,
             }))
-            print(f"[WebSocket] Sent grammar_correction to {player_id}: {event.data}")
+            logger.debug("[WebSocket] Sent grammar_correction to %s: %s", player_id, event.data)
         except Exception as e:
-            print(f"[WebSocket] Failed to send grammar_correction to {player_id}: {e}")
+            logger.warning("[WebSocket] Failed to send grammar_correction to %s: %s", player_id, e)
 
     event_bus.subscribe("grammar_correction", grammar_correction_handler)
 
-    try:
-        audio_buffer = bytearray()
-        streaming_mode = False  # Can be toggled by client
+    # Bound once; the per-turn send loops below reuse these locals
+    send_bytes = websocket.send_bytes
+    send_text = websocket.send_text
 
+    # Current utterance: frames stream into the orchestrator as they arrive
+    stream: Optional[_UtteranceStream] = None
+    turn_task: Optional[asyncio.Task] = None
+
+    try:
         while True:
             try:
                 message = await websocket.receive()
             except RuntimeError as e:
                 # Connection already closed by client
-                print(f"[WebSocket] Connection closed: {e}")
+                logger.debug("[WebSocket] Connection closed: %s", e)
                 break
 
-            if "bytes" in message:
-                # Accumulate audio chunks
-                audio_buffer.extend(message["bytes"])
-
-            elif "text" in message:
-                data = json.loads(message["text"])
-                msg_type = data.get("type")
+            if message["type"] == "websocket.disconnect":
+                logger.debug("[WebSocket] Client sent disconnect")
+                break
 
-                if msg_type == "end_utterance":
+            # Audio frames dominate traffic: one lookup, no second branch test
+            frame = message.get("bytes")
+            if frame is not None:
+                if stream is None:
+                    # First frame of a new utterance: start the turn now
+                    stream = _UtteranceStream()
+                    turn_task = asyncio.create_task(
+                        _collect_turn(orchestrator, player_id, npc_id, stream)
+                    )
+                stream.put(frame)
+                continue
+
+            text = message.get("text")
+            if text is not None:
+                control = _decode_control(text)
+
+                if isinstance(control, EndUtterance):
                     # Complete utterance received, process it
-                    if not audio_buffer:
+                    if stream is None:
                         continue
 
-                    print(f"[WebSocket] Processing {len(audio_buffer)} bytes of audio...")
-                    
-                    # Buffer audio and metadata separately to ensure proper ordering
-                    audio_chunks = []
-                    metadata_events = []
+                    stream.close()
+                    pending_task, stream, turn_task = turn_task, None, None
                     
                     try:
-                        async for item in orchestrator.process_conversation_turn(
-                            player_id=player_id,
-                            npc_id=npc_id,
-                            audio_bytes=bytes(audio_buffer),
-                        ):
-                            # Check if it's audio (bytes) or metadata (dict)
-                            if isinstance(item, bytes):
-                                print(f"[WebSocket] Buffering audio chunk #{len(audio_chunks) + 1} ({len(item)} bytes)")
-                                audio_chunks.append(item)
-                            elif isinstance(item, dict):
-                                # Buffer metadata events
-                                print(f"[WebSocket] Buffering metadata event: {item.get('type')}")
-                                metadata_events.append(item)
+                        audio_chunks, metadata_events = await pending_task
                         
                         # CRITICAL: Send ALL audio chunks BEFORE any metadata
                         # This prevents Unity from receiving turn_complete before audio arrives
-                        print(f"[WebSocket] Sending {len(audio_chunks)} audio chunks...")
-                        for idx, audio_chunk in enumerate(audio_chunks, 1):
-                            print(f"[WebSocket] Sending audio chunk #{idx}/{len(audio_chunks)} ({len(audio_chunk)} bytes)")
-                            await websocket.send_bytes(audio_chunk)
-                        
-                        print(f"[WebSocket] All {len(audio_chunks)} audio chunks sent successfully")
+                        coalescer = _AudioFrameCoalescer(send_bytes)
+                        for audio_chunk in audio_chunks:
+                            await coalescer.add(audio_chunk)
+                        await coalescer.flush()
+                        logger.debug("[WebSocket] Sent %d audio chunks", len(audio_chunks))
                         
                         # Now send metadata events
                         for event in metadata_events:
-                            print(f"[WebSocket] Sending metadata event: {event.get('type')}")
-                            await websocket.send_text(json.dumps(event))
+                            await send_text(_dumps(event))
                         
-                    except Exception as e:
-                        print(f"[WebSocket] Error during processing: {e}")
-                        import traceback
-                        traceback.print_exc()
+                    except Exception:
+                        logger.exception("[WebSocket] Error during processing")
                         raise
 
                     # Signal turn complete ONLY after all audio + metadata sent
-                    print("[WebSocket] Sending turn_complete signal")
-                    await websocket.send_text(json.dumps({"type": "turn_complete"}))
-                    audio_buffer.clear()
-
-                elif msg_type == "streaming":
-                    # Toggle streaming mode
-                    streaming_mode = data.get("enabled", False)
-                    await websocket.send_text(json.dumps({
-                        "type": "streaming_mode",
-                        "enabled": streaming_mode,
-                    }))
+                    await send_text(_TURN_COMPLETE)
 
     except WebSocketDisconnect:
-        print("[WebSocket] Client disconnected")
+        logger.info("[WebSocket] Client disconnected")
     except Exception as e:
-        print(f"[WebSocket] Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[WebSocket] Unexpected error: %s", e)
         try:
-            await websocket.send_text(json.dumps({"type": "error", "message": str(e)}))
+            await websocket.send_text(_dumps({"type": "error", "message": str(e)}))
             await websocket.close()
         except:
             # Connection already closed
             pass
     finally:
-        # Cleanup connection and event bus subscription
+        # Abandon a half-received utterance
+        if turn_task is not None:
+            turn_task.cancel()
+        # Cleanup event bus subscription (the handler holds this connection)
         event_bus.unsubscribe("grammar_correction", grammar_correction_handler)
-        if player_id in _active_connections:
-            del _active_connections[player_id]
-        print(f"[WebSocket] Cleaned up connection for player {player_id}")
+        logger.debug("[WebSocket] Cleaned up connection for player %s", player_id)
 
 
 @router.websocket("/ws/stream/{player_id}/{npc_id}")
@@ -231,67 +362,93 @@ async def conversation_websocket_streaming(
     Client → Server:
       - Binary frames: Audio chunks (sent continuously while speaking)
       - JSON text: {"type": "start_utterance"} when player starts speaking
+        (optionally with "encoding": "pcm_s16le", "sample_rate": 16000, "channels": 1)
       - JSON text: {"type": "stop_utterance"} when player stops speaking
     
     Server → Client:
       - Binary frames: NPC audio chunks (streamed)
       - JSON text: Events (grammar corrections, transcriptions)
+      - JSON text: {"type": "error", ...} if the announced audio format is unsupported
     """
     await websocket.accept()
-    _active_connections[player_id] = websocket
+
+    stream: Optional[_UtteranceStream] = None
+    turn_task: Optional[asyncio.Task] = None
+
+    send_text = websocket.send_text
+
+    async def stream_turn(utterance: _UtteranceStream) -> None:
+        # Audio goes out as soon as TTS produces it, metadata right behind it
+        coalescer = _AudioFrameCoalescer(websocket.send_bytes)
+        try:
+            async for item in orchestrator.process_streaming_conversation(
+                player_id=player_id,
+                npc_id=npc_id,
+                audio_stream=utterance.frames(),
+            ):
+                if isinstance(item, bytes):
+                    await coalescer.add(item)
+                else:
+                    await coalescer.flush()
+                    await send_text(_dumps(item))
+            await coalescer.flush()
+            await send_text(_TURN_COMPLETE)
+        except Exception as e:
+            # Runs detached from the receive loop, so report failures here
+            logger.exception("[WebSocket] Streaming turn failed")
+            await send_text(_dumps({"type": "error", "message": str(e)}))
+        finally:
+            # A barge-in cancels this task; don't let stale audio go out after it
+            coalescer.cancel()
     
     try:
-        audio_queue = asyncio.Queue()
-        recording = False
-        
-        async def audio_stream_generator():
-            """Generator that yields audio chunks from the queue."""
-            while recording:
-                try:
-                    chunk = await asyncio.wait_for(audio_queue.get(), timeout=5.0)
-                    yield chunk
-                except asyncio.TimeoutError:
-                    break
-        
         while True:
             message = await websocket.receive()
-            
-            if "bytes" in message and recording:
-                # Add audio chunk to queue
-                await audio_queue.put(message["bytes"])
-            
-            elif "text" in message:
-                data = json.loads(message["text"])
-                msg_type = data.get("type")
+            if message["type"] == "websocket.disconnect":
+                break
+
+            frame = message.get("bytes")
+            if frame is not None:
+                if stream is not None:
+                    # Feed the in-flight utterance
+                    stream.put(frame)
+                continue
+
+            text = message.get("text")
+            if text is not None:
+                control = _decode_control(text)
                 
-                if msg_type == "start_utterance":
-                    recording = True
-                    await audio_queue.put(b"")  # Prime the pump
+                if isinstance(control, StartUtterance) and stream is None:
+                    audio_format = (control.encoding, control.sample_rate, control.channels)
+                    if audio_format != _SUPPORTED_AUDIO_FORMAT:
+                        await send_text(_dumps({
+                            "type": "error",
+                            "message": f"Unsupported audio format {audio_format}; "
+                                       f"expected {_SUPPORTED_AUDIO_FORMAT}",
+                        }))
+                        continue
+                    # Barge-in: the player talking over the NPC stops its reply
+                    orchestrator.cancel_turn(player_id)
+                    stream = _UtteranceStream()
+                    turn_task = asyncio.create_task(stream_turn(stream))
                 
-                elif msg_type == "stop_utterance":
-                    recording = False
-                    
-                    # Process the streaming conversation
-                    async for audio_chunk in orchestrator.process_streaming_conversation(
-                        player_id=player_id,
-                        npc_id=npc_id,
-                        audio_stream=audio_stream_generator(),
-                    ):
-                        await websocket.send_bytes(audio_chunk)
-                    
-                    await websocket.send_text(json.dumps({"type": "turn_complete"}))
+                elif isinstance(control, StopUtterance) and stream is not None:
+                    # Keep receiving while the NPC answers so a new
+                    # start_utterance can interrupt it
+                    stream.close()
+                    stream = None
     
     except WebSocketDisconnect:
         pass
     except Exception as e:
         try:
-            await websocket.send_text(json.dumps({"type": "error", "message": str(e)}))
+            await websocket.send_text(_dumps({"type": "error", "message": str(e)}))
         except:
             pass
         await websocket.close()
     finally:
-        if player_id in _active_connections:
-            del _active_connections[player_id]
+        if turn_task is not None and not turn_task.done():
+            turn_task.cancel()
 
 
 @router.post("/{player_id}/correct")
@@ -328,33 +485,3 @@ async def get_mistake_summary(
     Used for generating targeted review sessions.
     """
     return await grammar_manager.get_mistake_summary(player_id)
-
-
-@router.post("/{player_id}/{npc_id}/conversation")
-async def start_conversation(
-    player_id: str,
-    npc_id: str,
-    orchestrator: DialogueOrchestratorDep,
-):
-    """
-    REST endpoint for non-WebSocket conversation (testing/debugging).
-    
-    Expects JSON body:
-    {
-        "audio_base64": "...",  // Base64-encoded audio
-        "format": "pcm",        // Audio format
-    }
-    
-    Returns:
-    {
-        "npc_audio_base64": "...",
-        "npc_text": "...",
-        "player_text": "..."
-    }
-    """
-    import base64
-    
-    # This would be implemented for REST-based testing
-    return {
-        "error": "Use WebSocket endpoint /ws/{player_id}/{npc_id} for conversations"
-    }
@@ -7,25 +7,29 @@ The WorldStateManager dispatches them to the appropriate Redis state updates.
 This is a lightweight HTTP endpoint for non-latency-critical game events.
 For high-frequency position updates, consider upgrading to a WebSocket in future.
 """
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request
 from typing import Any, Dict
 
+import msgspec
+
 from api.dependency import WorldStateManagerDep
 
 router = APIRouter()
 
 
-class GameEvent(BaseModel):
+class GameEvent(msgspec.Struct):
     player_id: str
     event_type: str   # e.g., "PlayerPickedObject", "SceneChanged"
     payload: Dict[str, Any] = {}
 
 
+_event_decoder = msgspec.json.Decoder(GameEvent)
+
+
 @router.post("/")
-async def ingest_event(event: GameEvent, world_state_manager: WorldStateManagerDep):
+async def ingest_event(request: Request, world_state_manager: WorldStateManagerDep):
     """
-    Ingest a game event from Unity and update the Redis world state.
+    Ingest a game event from Unity and queue it for the Redis world state.
 
     Supported event types:
       - PlayerMoved(x, y, z)
@@ -36,13 +40,23 @@ async def ingest_event(event: GameEvent, world_state_manager: WorldStateManagerD
       - SceneChanged(scene_id)
       - DialogueStarted(npc_id)
       - DialogueEnded(npc_id)
+
+    Body: {"player_id": str, "event_type": str, "payload": {...}}. It is decoded
+    with msgspec straight from the raw bytes; the payload is only shape-checked
+    as a JSON object and left to the per-event handler.
     """
+    try:
+        event = _event_decoder.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     await world_state_manager.handle_event(
         player_id=event.player_id,
         event_type=event.event_type,
         payload=event.payload,
     )
-    return {"status": "ok", "event": event.event_type}
+    # Applied to Redis within one coalescing tick, not before this returns
+    return {"status": "queued", "event": event.event_type}
 
 
 @router.get("/{player_id}/state")
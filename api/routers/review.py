@@ -5,14 +5,23 @@ Unity polls this endpoint every 15 active gameplay minutes.
 The ReviewScheduler checks if review should be triggered and generates
 a dynamic exercise session based on the player's mistake history.
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
-from dataclasses import asdict
+
+import msgspec
 
 from api.dependency import ReviewSchedulerDep
 
 router = APIRouter()
 
+_encoder = msgspec.json.Encoder()
+
+
+def _json_response(content) -> Response:
+    # msgspec walks the ReviewSession dataclass (datetimes included) straight to
+    # JSON bytes, skipping asdict() and FastAPI's own encoding pass.
+    return Response(content=_encoder.encode(content), media_type="application/json")
+
 
 class ReviewCheckRequest(BaseModel):
     player_id: str
@@ -34,14 +43,14 @@ async def check_review(body: ReviewCheckRequest, review_scheduler: ReviewSchedul
         return {"trigger_review": False}
 
     session = await review_scheduler.generate_review_session(body.player_id)
-    return {
+    return _json_response({
         "trigger_review": True,
-        "session": asdict(session),
-    }
+        "session": session,
+    })
 
 
 @router.post("/{player_id}/generate")
 async def generate_review(player_id: str, review_scheduler: ReviewSchedulerDep):
     """Force-generate a review session for a player (for testing / manual triggers)."""
     session = await review_scheduler.generate_review_session(player_id)
-    return asdict(session)
+    return _json_response(session)
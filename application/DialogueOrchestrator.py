@@ -15,10 +15,16 @@ Key Design Principles:
 - Context is injected from Redis world state
 """
 import asyncio
-import json
+import io
+import logging
+import string
+from functools import lru_cache
 from typing import AsyncGenerator, Optional, Callable
 from datetime import datetime
 
+import msgspec
+from cachetools import TTLCache
+
 from domain.interfaces.ILargeLanguageModel import ILargeLanguageModel
 from domain.interfaces.ISpeechToText import ISpeechToText
 from domain.interfaces.ITextToSpeech import ITextToSpeech
@@ -28,7 +34,13 @@ from domain.interfaces.IRepositories import (
     INPCRepository,
     IPlayerProfileRepository,
 )
-from domain.models import ConversationTurn
+from domain.models import (
+    GRAMMAR_CORRECTION_SCHEMA,
+    ConversationTurn,
+    GrammarCorrectionResult,
+)
+
+logger = logging.getLogger(__name__)
 
 
 _GRAMMAR_SYSTEM_PROMPT = """
@@ -44,7 +56,7 @@ Return ONLY valid JSON with this exact schema (no extra text):
   "severity": 1-5
 }}
 
-Student utterance: "{utterance}"
+The student's utterance is the user message.
 
 Be strict but fair. Do not invent mistakes. If perfect, set mistake_found to false.
 """
@@ -79,6 +91,56 @@ Respond naturally as {npc_name}.
 """
 
 
+def _compile_prompt(template: str, defaults: Optional[dict] = None) -> Callable[..., str]:
+    """
+    Parse a str.format template once and return a renderer for it.
+
+    The renderer takes the same keyword arguments as template.format(); keys
+    missing from the call fall back to `defaults`.
+    """
+    segments = [
+        (literal, field)
+        for literal, field, _spec, _conversion in string.Formatter().parse(template)
+    ]
+    base = defaults or {}
+
+    def render(**params) -> str:
+        values = base | params
+        return "".join(
+            literal if field is None else literal + str(values[field])
+            for literal, field in segments
+        )
+
+    return render
+
+
+_render_grammar_prompt = _compile_prompt(_GRAMMAR_SYSTEM_PROMPT)
+
+
+@lru_cache(maxsize=64)
+def _grammar_system_prompt(target_language: str) -> str:
+    # Byte-identical per language (the utterance goes in the user message), so
+    # providers with automatic prefix caching can reuse the prefill across calls
+    return _render_grammar_prompt(target_language=target_language)
+
+
+# Built once: parses and validates the grammar LLM's JSON in a single pass
+_GRAMMAR_DECODER = msgspec.json.Decoder(GrammarCorrectionResult)
+
+_render_npc_prompt = _compile_prompt(
+    _NPC_SYSTEM_PROMPT,
+    defaults={
+        "object_in_hand": "nothing",
+        "active_quest": "none",
+        "relationship_score": 0,
+        "target_language": "English",
+        "npc_cefr": "B1",
+        "emotional_tone": "neutral",
+        "proficiency_level": "A2",
+    },
+)
+
+
 # Maps scene_id values to a human-readable description injected into the LLM prompt.
 # Add new scenes here as the game grows.
 _SCENE_DESCRIPTIONS = {
@@ -109,6 +171,13 @@ class DialogueOrchestrator:
         tts_service: ITextToSpeech,
         llm_service: ILargeLanguageModel,
         event_callback: Optional[Callable] = None,
+        phrase_max_chars: int = 80,
+        phrase_min_chars_at_comma: int = 20,
+        phrase_max_delay_seconds: float = 0.3,
+        npc_profile_ttl_seconds: float = 300,
+        player_profile_ttl_seconds: float = 10,
+        grammar_workers: int = 8,
+        grammar_queue_size: int = 256,
     ):
         self._world_state = world_state_repo
         self._mistakes = mistake_repo
@@ -118,6 +187,26 @@ class DialogueOrchestrator:
         self._tts = tts_service
         self._llm = llm_service
         self._event_callback = event_callback  # For broadcasting events (grammar corrections, etc.)
+        # LLM → TTS phrase aggregation thresholds
+        self._phrase_max_chars = phrase_max_chars
+        self._phrase_min_chars_at_comma = phrase_min_chars_at_comma
+        self._phrase_max_delay_seconds = phrase_max_delay_seconds
+        # Profiles rarely change mid-session; keep them in-process for a while.
+        # NPC rows are static reference data, so they can live much longer.
+        self._npc_cache = TTLCache(maxsize=1024, ttl=npc_profile_ttl_seconds)
+        self._player_cache = TTLCache(maxsize=8192, ttl=player_profile_ttl_seconds)
+        # Last known STT language per player, so STT can start before any Redis read
+        self._language_hints = TTLCache(maxsize=8192, ttl=300)
+        # Background grammar checks go through a bounded queue drained by a fixed
+        # worker pool, so they can never take more than grammar_workers LLM slots
+        self._grammar_queue: asyncio.Queue = asyncio.Queue(maxsize=grammar_queue_size)
+        self._grammar_worker_count = grammar_workers
+        self._grammar_workers: list[asyncio.Task] = []
+        self._grammar_dropped = 0
+        # Fire-and-forget work that must still be awaited on shutdown
+        self._bg_tasks: set[asyncio.Task] = set()
+        # player_id → task currently running that player's turn (for barge-in)
+        self._active_turns: dict[str, asyncio.Task] = {}
 
     # ============================================================================
     # PRIMARY WORKFLOW: Full Conversation Round-Trip
@@ -141,114 +230,253 @@ class DialogueOrchestrator:
             - Audio chunks (bytes) from TTS for streaming to Unity client
             - Metadata dicts: {"type": "transcription", "text": "..."} or {"type": "npc_text", "text": "..."}
         """
-        print(f"[Orchestrator] Starting conversation turn for player={player_id}, npc={npc_id}")
-        
-        # Step 1: Transcribe audio to text
-        print(f"[Orchestrator] Step 1: Getting player state...")
-        state = await self._world_state.get_player_state(player_id)
-        language = state.get("language", "en")
-        
-        print(f"[Orchestrator] Step 1: Transcribing {len(audio_bytes)} bytes of audio (language={language})...")
-        player_text = await self._stt.transcribe(audio_bytes, language=language)
-        print(f"[Orchestrator] Transcription result: '{player_text}'")
-        
-        if not player_text.strip():
-            print("[Orchestrator] No speech detected, returning")
-            return  # No speech detected
-        
-        # Yield transcription
-        yield {"type": "transcription", "text": player_text}
-        
-        # Step 2: Persist player's turn
-        print(f"[Orchestrator] Step 2: Persisting player turn...")
-        await self._world_state.append_conversation_turn(
-            player_id, npc_id, "player", player_text
-        )
-        
-        # Step 3: Fire grammar correction in background (non-blocking)
-        print(f"[Orchestrator] Step 3: Starting grammar correction task...")
-        asyncio.create_task(
-            self._process_grammar_correction_async(player_id, player_text, language)
-        )
-        
-        # Step 4: Generate NPC response (streaming LLM → streaming TTS)
-        print(f"[Orchestrator] Step 4: Generating NPC response stream...")
-        npc_reply_parts = []
-        
-        chunk_num = 0
-        async for audio_chunk in self._generate_npc_response_stream(
-            player_id, npc_id, player_text, state, npc_reply_parts
-        ):
-            chunk_num += 1
-            print(f"[Orchestrator] Yielding audio chunk #{chunk_num} ({len(audio_chunk)} bytes)")
-            yield audio_chunk
-        
-        print(f"[Orchestrator] Total chunks yielded: {chunk_num}")
-        
-        # Yield complete NPC text response
-        npc_full_text = "".join(npc_reply_parts)
-        print(f"[Orchestrator] NPC complete response: '{npc_full_text}'")
-        yield {"type": "npc_text", "text": npc_full_text}
-        
-        # Step 5: Persist NPC's turn after streaming completes
-        full_npc_reply = "".join(npc_reply_parts)
-        print(f"[Orchestrator] Step 5: Persisting NPC reply: '{full_npc_reply[:100]}...'")
-        await self._world_state.append_conversation_turn(
-            player_id, npc_id, "npc", full_npc_reply
-        )
-        
-        print("[Orchestrator] Conversation turn complete")
+        # A new turn for this player barges in on any response still playing
+        self._claim_turn(player_id)
+        try:
+            logger.debug("Starting conversation turn for player=%s, npc=%s", player_id, npc_id)
+
+            # Step 1: Transcribe audio to text. With a cached language hint the
+            # context is only fetched once we know the player actually spoke.
+            language = self._language_hints.get(player_id)
+            context = None
+            if language is None:
+                logger.debug("Step 1: Fetching turn context")
+                context = await self._fetch_turn_context(player_id, npc_id)
+                language = self._remember_language(player_id, context)
+
+            logger.debug("Step 1: Transcribing %d bytes of audio (language=%s)", len(audio_bytes), language)
+            player_text = await self._stt.transcribe(audio_bytes, language=language)
+            logger.debug("Transcription result: %r", player_text)
+
+            if not player_text.strip():
+                logger.debug("No speech detected, returning")
+                return  # No speech detected
+
+            if context is None:
+                context = await self._fetch_turn_context(player_id, npc_id)
+                self._remember_language(player_id, context)
+
+            async for item in self._respond_to_player_text(
+                player_id, npc_id, player_text, context, language
+            ):
+                yield item
+        finally:
+            self._release_turn(player_id)
 
     async def process_streaming_conversation(
         self,
         player_id: str,
         npc_id: str,
         audio_stream: AsyncGenerator[bytes, None],
-    ) -> AsyncGenerator[bytes, None]:
+    ) -> AsyncGenerator[bytes | dict, None]:
         """
         Streaming variant: processes audio chunks as they arrive.
         
         This enables true real-time transcription with streaming STT services
-        like Deepgram that support incremental transcription.
+        like Deepgram that support incremental transcription. The caller can
+        start this while the player is still speaking; STT consumes frames as
+        they are produced instead of waiting for one joined buffer.
         
         Args:
             audio_stream: Async generator yielding audio chunks from Unity
         
         Yields:
-            NPC audio response chunks
+            Same items as process_conversation_turn: audio chunks (bytes) and
+            transcription / npc_text metadata dicts. While the player is still
+            speaking, interim STT results are yielded as partial_transcription
+            dicts so the client can show live captions or detect barge-in.
         """
-        state = await self._world_state.get_player_state(player_id)
-        language = state.get("language", "en")
-        
-        # Step 1: Streaming STT
-        transcript_parts = []
-        async for text_chunk in self._stt.transcribe_stream(audio_stream, language=language):
-            transcript_parts.append(text_chunk)
-        
-        player_text = " ".join(transcript_parts).strip()
-        
-        if not player_text:
-            return
-        
-        # Step 2-5: Same as process_conversation_turn
-        await self._world_state.append_conversation_turn(
-            player_id, npc_id, "player", player_text
+        # A new turn for this player barges in on any response still playing
+        self._claim_turn(player_id)
+        try:
+            language = self._language_hints.get(player_id)
+            context = None
+            if language is None:
+                context = await self._fetch_turn_context(player_id, npc_id)
+                language = self._remember_language(player_id, context)
+
+            # Step 1: Streaming STT — commit final segments, surface interim ones live
+            # Committed text grows in one buffer; interim results append to a copy
+            transcript = io.StringIO()
+            context_task: Optional[asyncio.Task] = None
+            try:
+                async for is_final, text_chunk in self._stt.transcribe_stream(audio_stream, language=language):
+                    if context is None and context_task is None and text_chunk.strip():
+                        # First real speech: fetch context while STT carries on
+                        context_task = asyncio.create_task(
+                            self._fetch_turn_context(player_id, npc_id)
+                        )
+                    if is_final:
+                        transcript.write(text_chunk)
+                        transcript.write(" ")
+                    else:
+                        yield {
+                            "type": "partial_transcription",
+                            "text": transcript.getvalue() + text_chunk,
+                        }
+
+                player_text = transcript.getvalue().strip()
+
+                if not player_text:
+                    return
+
+                if context is None:
+                    context = await context_task
+                    self._remember_language(player_id, context)
+            finally:
+                if context_task is not None and not context_task.done():
+                    context_task.cancel()
+
+            # Step 2-5: Same as process_conversation_turn
+            async for item in self._respond_to_player_text(
+                player_id, npc_id, player_text, context, language
+            ):
+                yield item
+        finally:
+            self._release_turn(player_id)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """create_task that keeps a reference until the task finishes (see shutdown)."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    async def shutdown(self, grace_seconds: float = 5.0) -> None:
+        """
+        Let queued grammar checks and pending writes finish (up to grace_seconds),
+        then stop the grammar workers.
+        """
+        if self._grammar_workers:
+            try:
+                await asyncio.wait_for(self._grammar_queue.join(), grace_seconds)
+            except asyncio.TimeoutError:
+                logger.warning("Dropping %d queued grammar checks on shutdown", self._grammar_queue.qsize())
+        await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+        for worker in self._grammar_workers:
+            worker.cancel()
+        await asyncio.gather(*self._grammar_workers, return_exceptions=True)
+        self._grammar_workers = []
+
+    def cancel_turn(self, player_id: str) -> bool:
+        """
+        Stop the player's in-flight turn (LLM + TTS included), e.g. when VAD
+        reports the player talking over the NPC. Returns whether one was running.
+        """
+        task = self._active_turns.pop(player_id, None)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    def _claim_turn(self, player_id: str) -> None:
+        current = asyncio.current_task()
+        previous = self._active_turns.get(player_id)
+        if previous is not None and previous is not current and not previous.done():
+            logger.debug("Barge-in: cancelling previous turn for player=%s", player_id)
+            previous.cancel()
+        self._active_turns[player_id] = current
+
+    def _release_turn(self, player_id: str) -> None:
+        if self._active_turns.get(player_id) is asyncio.current_task():
+            del self._active_turns[player_id]
+
+    def _remember_language(self, player_id: str, context: tuple) -> str:
+        language = context[0].get("language", "en")
+        self._language_hints[player_id] = language
+        return language
+
+    async def _fetch_turn_context(self, player_id: str, npc_id: str) -> tuple:
+        """
+        Fetch everything a turn needs in one concurrent batch, before STT:
+        (player state, NPC profile, formatted history lines, player profile).
+
+        History is read before the new player turn is appended; the current
+        utterance reaches the LLM as the user message instead.
+        """
+        (state, history), npc_profile, player_profile = await asyncio.gather(
+            self._world_state.get_turn_context(player_id, npc_id, window=10),
+            self._cached_npc_profile(npc_id),
+            self._cached_player_profile(player_id),
         )
-        
-        asyncio.create_task(
-            self._process_grammar_correction_async(player_id, player_text, language)
+        return state, npc_profile, history, player_profile
+
+    async def _cached_npc_profile(self, npc_id: str) -> dict:
+        profile = self._npc_cache.get(npc_id)
+        if profile is None:
+            profile = await self._npcs.get_npc_profile(npc_id)
+            self._npc_cache[npc_id] = profile
+        return profile
+
+    async def _cached_player_profile(self, player_id: str) -> dict:
+        profile = self._player_cache.get(player_id)
+        if profile is None:
+            profile = await self._players.get_profile(player_id)
+            self._player_cache[player_id] = profile
+        return profile
+
+    def invalidate_npc(self, npc_id: str) -> None:
+        """Drop a cached NPC profile, e.g. after its relationship score changes."""
+        self._npc_cache.pop(npc_id, None)
+
+    def invalidate_player(self, player_id: str) -> None:
+        """Drop a cached player profile, e.g. after a proficiency update."""
+        self._player_cache.pop(player_id, None)
+
+    async def _respond_to_player_text(
+        self,
+        player_id: str,
+        npc_id: str,
+        player_text: str,
+        context: tuple,
+        language: str,
+    ) -> AsyncGenerator[bytes | dict, None]:
+        """
+        Everything after transcription, shared by the batch and streaming entry points.
+        """
+        # Step 2: Fire grammar correction in background first (non-blocking)
+        logger.debug("Step 2: Queueing grammar correction")
+        self._enqueue_grammar_correction(player_id, player_text, language)
+        
+        # Step 3: Persist player's turn off the critical path (context is already fetched)
+        logger.debug("Step 3: Persisting player turn")
+        persist_player_turn = self._spawn(
+            self._world_state.append_conversation_turn(
+                player_id, npc_id, "player", player_text, speaker="PLAYER"
+            )
         )
         
+        # Yield transcription
+        yield {"type": "transcription", "text": player_text}
+        
+        # Step 4: Generate NPC response (streaming LLM → streaming TTS)
+        logger.debug("Step 4: Generating NPC response stream")
         npc_reply_parts = []
+        
+        chunk_num = 0
         async for audio_chunk in self._generate_npc_response_stream(
-            player_id, npc_id, player_text, state, npc_reply_parts
+            player_text, context, npc_reply_parts
         ):
+            chunk_num += 1
+            logger.debug("Yielding audio chunk #%d (%d bytes)", chunk_num, len(audio_chunk))
             yield audio_chunk
         
-        full_npc_reply = "".join(npc_reply_parts)
+        logger.debug("Total chunks yielded: %d", chunk_num)
+        
+        # Yield complete NPC text response
+        npc_full_text = "".join(npc_reply_parts)
+        logger.debug("NPC complete response: %r", npc_full_text)
+        yield {"type": "npc_text", "text": npc_full_text}
+        
+        # Step 5: Persist NPC's turn after streaming completes (player turn first)
+        logger.debug("Step 5: Persisting NPC reply: %.100r", npc_full_text)
+        await persist_player_turn
         await self._world_state.append_conversation_turn(
-            player_id, npc_id, "npc", full_npc_reply
+            player_id, npc_id, "npc", npc_full_text,
+            speaker=context[1]["name"].upper(),
         )
+        
+        logger.debug("Conversation turn complete")
 
     # ============================================================================
     # PRIVATE HELPERS: NPC Response Generation
@@ -256,27 +484,19 @@ class DialogueOrchestrator:
 
     async def _generate_npc_response_stream(
         self,
-        player_id: str,
-        npc_id: str,
         player_text: str,
-        state: dict,
+        context: tuple,
         reply_collector: list,
     ) -> AsyncGenerator[bytes, None]:
         """
         Core streaming pipeline: LLM → TTS
         
-        1. Fetch context (NPC profile, conversation history)
-        2. Build dynamic system prompt
-        3. Stream LLM response text
-        4. Stream text chunks to TTS
-        5. Yield audio chunks as they're generated
+        1. Build dynamic system prompt from the prefetched turn context
+        2. Stream LLM response text
+        3. Stream text chunks to TTS
+        4. Yield audio chunks as they're generated
         """
-        # Fetch all context in parallel
-        npc_profile, history, player_profile = await asyncio.gather(
-            self._npcs.get_npc_profile(npc_id),
-            self._world_state.get_conversation_history(player_id, npc_id, window=10),
-            self._players.get_profile(player_id),
-        )
+        state, npc_profile, history, player_profile = context
         
         # Build dynamic system prompt with context injection
         system_prompt = self._build_npc_system_prompt(
@@ -286,18 +506,71 @@ class DialogueOrchestrator:
         # Stream LLM response
         llm_stream = self._llm.stream_complete(system_prompt, player_text)
         
-        # Create a generator that collects LLM chunks while passing them through
-        async def _llm_with_collection() -> AsyncGenerator[str, None]:
-            async for chunk in llm_stream:
-                reply_collector.append(chunk)
-                yield chunk
-        
-        # Stream to TTS and yield audio chunks
+        # Stream phrases (not raw tokens) to TTS and yield audio chunks
         voice_id = npc_profile.get("voice_id", "")
-        async for audio_chunk in self._tts.synthesize_stream(
-            _llm_with_collection(), voice_id
-        ):
-            yield audio_chunk
+        phrases = self._aggregate_phrases(llm_stream, reply_collector)
+        audio_stream = self._tts.synthesize_stream(phrases, voice_id)
+        try:
+            async for audio_chunk in audio_stream:
+                yield audio_chunk
+        finally:
+            # On barge-in, close each stage now so the LLM request and TTS stop
+            await audio_stream.aclose()
+            await phrases.aclose()
+            await llm_stream.aclose()
+
+    async def _aggregate_phrases(
+        self,
+        llm_stream: AsyncGenerator[str, None],
+        reply_collector: list,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Regroup raw LLM tokens into phrases for TTS, collecting them as it goes.
+
+        A phrase is emitted when the buffer ends a sentence (. ! ?), ends with a
+        comma after phrase_min_chars_at_comma chars, reaches phrase_max_chars, or
+        the LLM has been silent for phrase_max_delay_seconds.
+        """
+        buffer = ""
+        stream = aiter(llm_stream)
+        pending = asyncio.ensure_future(anext(stream))
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {pending}, timeout=self._phrase_max_delay_seconds
+                )
+                if not done:
+                    # LLM stalled: flush what we have, keep waiting on the same chunk
+                    if buffer:
+                        reply_collector.append(buffer)
+                        yield buffer
+                        buffer = ""
+                    continue
+
+                try:
+                    chunk = pending.result()
+                except StopAsyncIteration:
+                    break
+                pending = asyncio.ensure_future(anext(stream))
+
+                buffer += chunk
+                tail = buffer.rstrip()
+                if (
+                    tail.endswith((".", "!", "?"))
+                    or (tail.endswith(",") and len(tail) >= self._phrase_min_chars_at_comma)
+                    or len(buffer) >= self._phrase_max_chars
+                ):
+                    reply_collector.append(buffer)
+                    yield buffer
+                    buffer = ""
+        finally:
+            # Let the cancelled read settle so llm_stream is free to be closed
+            pending.cancel()
+            await asyncio.wait({pending})
+
+        if buffer:
+            reply_collector.append(buffer)
+            yield buffer
 
     def _build_npc_system_prompt(
         self,
@@ -308,11 +581,9 @@ class DialogueOrchestrator:
     ) -> str:
         """
         Dynamically assembles the NPC system prompt with real-time context injection.
+        `history` holds lines already formatted by the repository on append.
         """
-        history_text = "\n".join(
-            f"{'PLAYER' if t['role'] == 'player' else npc_profile['name'].upper()}: {t['content']}"
-            for t in history
-        ) or "(First interaction)"
+        history_text = "\n".join(history) or "(First interaction)"
 
         scene_id = state.get("scene_id", "supermarket")
         scene_description = _SCENE_DESCRIPTIONS.get(
@@ -320,7 +591,7 @@ class DialogueOrchestrator:
             f"A {scene_id.replace('_', ' ')} setting."
         )
 
-        return _NPC_SYSTEM_PROMPT.format(
+        return _render_npc_prompt(
             npc_name=npc_profile["name"],
             npc_personality=npc_profile["personality"],
             npc_backstory=npc_profile["backstory"],
@@ -340,6 +611,37 @@ class DialogueOrchestrator:
     # GRAMMAR CORRECTION: Parallel, Non-Blocking Path
     # ============================================================================
 
+    def _enqueue_grammar_correction(
+        self, player_id: str, player_text: str, language: str
+    ) -> None:
+        """
+        Hand a grammar check to the worker pool without waiting.
+        When the queue is full the check is dropped (and counted) rather than
+        letting background work compete with the conversation for the LLM.
+        """
+        if not self._grammar_workers:
+            # Started lazily: the container builds the orchestrator outside the event loop
+            self._grammar_workers = [
+                asyncio.create_task(self._grammar_worker())
+                for _ in range(self._grammar_worker_count)
+            ]
+        try:
+            self._grammar_queue.put_nowait((player_id, player_text, language))
+        except asyncio.QueueFull:
+            self._grammar_dropped += 1
+            logger.warning(
+                "Grammar queue full; dropped check for player=%s (%d dropped so far)",
+                player_id, self._grammar_dropped,
+            )
+
+    async def _grammar_worker(self) -> None:
+        while True:
+            player_id, player_text, language = await self._grammar_queue.get()
+            try:
+                await self._process_grammar_correction_async(player_id, player_text, language)
+            finally:
+                self._grammar_queue.task_done()
+
     async def _process_grammar_correction_async(
         self,
         player_id: str,
@@ -357,22 +659,21 @@ class DialogueOrchestrator:
         Failures are caught and logged — grammar correction must never crash the game.
         """
         try:
-            system_prompt = _GRAMMAR_SYSTEM_PROMPT.format(
-                target_language=language.capitalize(),
-                utterance=player_text,
-            )
+            system_prompt = _grammar_system_prompt(language.capitalize())
             
-            raw_result = await self._llm.complete(system_prompt, "Analyze the utterance above.")
-            result = json.loads(raw_result)
+            raw_result = await self._llm.complete(
+                system_prompt, player_text, schema=GRAMMAR_CORRECTION_SCHEMA
+            )
+            result = _GRAMMAR_DECODER.decode(raw_result)
             
-            if result.get("mistake_found"):
+            if result.mistake_found:
                 # Persist to database
                 await self._mistakes.log_mistake(
                     player_id=player_id,
-                    category=result.get("category", "unknown"),
-                    original=result.get("original", player_text),
-                    correction=result.get("correction", ""),
-                    explanation=result.get("explanation", ""),
+                    category=result.category or "unknown",
+                    original=result.original or player_text,
+                    correction=result.correction,
+                    explanation=result.explanation,
                 )
                 
                 # Broadcast event (for WebSocket notification to Unity)
@@ -380,13 +681,16 @@ class DialogueOrchestrator:
                     await self._event_callback({
                         "type": "grammar_correction",
                         "player_id": player_id,
-                        "data": result,
+                        "data": msgspec.structs.asdict(result),
                         "timestamp": datetime.utcnow().isoformat(),
                     })
         
+        except msgspec.DecodeError as e:
+            # The LLM ignored the JSON schema; nothing to persist for this turn
+            logger.warning("Grammar correction returned invalid JSON (non-fatal): %s", e)
         except Exception as e:
             # Grammar correction failures must not interrupt gameplay
-            print(f"[DialogueOrchestrator] Grammar correction failed (non-fatal): {e}")
+            logger.warning("Grammar correction failed (non-fatal): %s", e)
 
     # ============================================================================
     # EXPLICIT GRAMMAR CHECK (for REST API)
@@ -402,22 +706,21 @@ class DialogueOrchestrator:
         Synchronous grammar correction for explicit REST API calls.
         Used when Unity explicitly requests grammar feedback outside the live flow.
         """
-        system_prompt = _GRAMMAR_SYSTEM_PROMPT.format(
-            target_language=language,
-            utterance=player_text,
-        )
+        system_prompt = _grammar_system_prompt(language)
         
-        raw_result = await self._llm.complete(system_prompt, "Analyze the utterance above.")
-        result = json.loads(raw_result)
+        raw_result = await self._llm.complete(
+            system_prompt, player_text, schema=GRAMMAR_CORRECTION_SCHEMA
+        )
+        result = _GRAMMAR_DECODER.decode(raw_result)
         
         # Optionally persist the mistake
-        if result.get("mistake_found"):
+        if result.mistake_found:
             await self._mistakes.log_mistake(
                 player_id=player_id,
-                category=result.get("category", "unknown"),
-                original=result.get("original", player_text),
-                correction=result.get("correction", ""),
-                explanation=result.get("explanation", ""),
+                category=result.category or "unknown",
+                original=result.original or player_text,
+                correction=result.correction,
+                explanation=result.explanation,
             )
         
-        return result
+        return msgspec.structs.asdict(result)
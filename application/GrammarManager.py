@@ -4,11 +4,15 @@ GrammarManager — application-layer manager for explicit grammar correction que
 Used by the REST endpoint (if Unity wants to explicitly query corrections
 outside the live conversation loop e.g. for a dedicated feedback UI).
 """
-import json
+import string
+import unicodedata
+
+import msgspec
+from cachetools import TTLCache
 
 from domain.interfaces.ILargeLanguageModel import ILargeLanguageModel
 from domain.interfaces.IRepositories import IMistakeRepository
-from domain.models import GrammarCorrectionResult
+from domain.models import GRAMMAR_CORRECTION_SCHEMA, GrammarCorrectionResult
 
 
 _CORRECTION_SYSTEM_PROMPT = """
@@ -27,6 +31,23 @@ Return ONLY a JSON object with this exact schema:
 Do not include any other text. Be precise and pedagogically accurate.
 """
 
+# Rendered once per supported language: the hot path does a dict lookup, and
+# each language's prompt is the same string object on every call
+_CORRECTION_PROMPTS = {
+    lang: _CORRECTION_SYSTEM_PROMPT.format(target_language=lang)
+    for lang in ("English", "French", "Spanish", "German", "Italian")
+}
+
+_RESULT_DECODER = msgspec.json.Decoder(GrammarCorrectionResult)
+
+_STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation + "¿¡«»…“”‘’")
+
+
+def _normalize_utterance(utterance: str) -> str:
+    """Cache key form: NFC, case-folded, punctuation dropped, whitespace collapsed."""
+    text = unicodedata.normalize("NFC", utterance).casefold()
+    return " ".join(text.translate(_STRIP_PUNCTUATION).split())
+
 
 class GrammarManager:
     def __init__(
@@ -36,6 +57,8 @@ class GrammarManager:
     ):
         self._llm = llm_service
         self._mistakes = mistake_repo
+        # Learners repeat the same sentences; identical utterances skip the LLM
+        self._corrections = TTLCache(maxsize=4096, ttl=24 * 3600)
 
     async def correct(
         self, player_id: str, utterance: str, target_language: str = "English"
@@ -43,20 +66,28 @@ class GrammarManager:
         """
         Analyze a player's utterance for grammar mistakes.
         Returns a structured GrammarCorrectionResult and persists the mistake if found.
+        Repeated utterances (after normalization) are answered from a 24 h cache,
+        but their mistakes are still logged.
         """
-        system_prompt = _CORRECTION_SYSTEM_PROMPT.format(target_language=target_language)
-        raw = await self._llm.complete(system_prompt, utterance)
-        data = json.loads(raw)
-
-        result = GrammarCorrectionResult(
-            mistake_found=data.get("mistake_found", False),
-            category=data.get("category", "none"),
-            original=data.get("original", ""),
-            correction=data.get("correction", ""),
-            explanation=data.get("explanation", ""),
-            severity=data.get("severity", 0),
+        cache_key = (target_language, _normalize_utterance(utterance))
+        result = self._corrections.get(cache_key)
+        if result is None:
+            raw = await self._llm.complete(
+                self._system_prompt(target_language), utterance, schema=GRAMMAR_CORRECTION_SCHEMA
+            )
+            result = _RESULT_DECODER.decode(raw)
+            self._corrections[cache_key] = result
+
+        await self._log_if_mistake(player_id, result)
+        return result
+
+    def _system_prompt(self, target_language: str) -> str:
+        return (
+            _CORRECTION_PROMPTS.get(target_language)
+            or _CORRECTION_SYSTEM_PROMPT.format(target_language=target_language)
         )
 
+    async def _log_if_mistake(self, player_id: str, result: GrammarCorrectionResult) -> None:
         if result.mistake_found:
             await self._mistakes.log_mistake(
                 player_id=player_id,
@@ -66,8 +97,6 @@ class GrammarManager:
                 explanation=result.explanation,
             )
 
-        return result
-
     async def get_mistake_summary(self, player_id: str) -> list:
         """Return the top recurring mistake categories for the given player."""
         return await self._mistakes.get_top_mistakes(player_id, limit=5)
@@ -4,46 +4,67 @@ ReviewScheduler — generates adaptive review sessions based on mistake history.
 Triggered by the review endpoint (which Unity polls every 15 minutes of active play).
 Queries the top recurring mistakes and uses the LLM to generate targeted exercises.
 """
-import json
-from typing import Dict, Any
+import asyncio
+import logging
+from typing import Dict, Any, List
+
+import msgspec
+import orjson
 
 from domain.interfaces.ILargeLanguageModel import ILargeLanguageModel
 from domain.interfaces.IRepositories import IMistakeRepository
-from domain.models import ReviewSession
-
-
-_REVIEW_GENERATION_PROMPT = """
-You are a language learning curriculum designer. Based on a student's recent grammar mistakes,
-generate a focused 5-minute review session.
-
-The student's top mistake categories (most frequent first):
-{mistake_summary}
-
-Recent mistake examples:
-{mistake_examples}
-
-Generate a JSON review session with this structure:
-{{
-  "title": "Session title",
-  "exercises": [
-    {{
-      "type": "fill_in_blank | multiple_choice | correction | translation",
-      "instruction": "Task instruction in English",
-      "prompt": "The exercise text (in the target language where applicable)",
-      "options": ["option1", "option2", "option3", "option4"],  // for multiple_choice only
-      "correct_answer": "The correct answer",
-      "explanation": "Why this is correct"
-    }}
-  ]
-}}
-
-- Generate exactly 5 exercises
-- Focus on the top 2-3 mistake categories 
+from domain.models import ReviewExercise, ReviewSession
+
+logger = logging.getLogger(__name__)
+
+# Static instructions, sent as the system prompt so they form an identical
+# prefix on every call; only the category and the student's mistakes vary
+# (user message).
+_EXERCISE_SYSTEM_PROMPT = """
+You are a language learning curriculum designer. Write ONE exercise for a focused
+5-minute review session, targeting the given grammar mistake category at the given
+difficulty (1 = easiest, 5 = hardest). Always respond with valid JSON only.
+
+Generate a JSON exercise with this structure:
+{
+  "type": "fill_in_blank | multiple_choice | correction | translation",
+  "instruction": "Task instruction in English",
+  "prompt": "The exercise text (in the target language where applicable)",
+  "options": ["option1", "option2", "option3", "option4"],  // for multiple_choice only
+  "correct_answer": "The correct answer",
+  "explanation": "Why this is correct"
+}
+
 - Use contextual examples from the student's actual mistakes where possible
-- Make exercises progressively harder (1-5)
 - Be encouraging in tone
 """
 
+# Mirrors the structure described above, for LLM structured-output modes
+_EXERCISE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "type": {
+            "type": "string",
+            "enum": ["fill_in_blank", "multiple_choice", "correction", "translation"],
+        },
+        "instruction": {"type": "string"},
+        "prompt": {"type": "string"},
+        "options": {"type": "array", "items": {"type": "string"}},
+        "correct_answer": {"type": "string"},
+        "explanation": {"type": "string"},
+    },
+    "required": ["type", "instruction", "prompt", "correct_answer", "explanation"],
+}
+
+_EXERCISE_DECODER = msgspec.json.Decoder(ReviewExercise)
+
+_EXERCISES_PER_SESSION = 5
+# Fixed difficulty scale, matching "1 = easiest, 5 = hardest" in the system prompt
+_DIFFICULTY_SCALE = 5
+# Exercises cycle over at most this many of the top categories
+_MAX_CATEGORIES = 3
+_EXAMPLES_PER_EXERCISE = 3
+
 
 class ReviewScheduler:
     def __init__(
@@ -59,9 +80,11 @@ class ReviewScheduler:
         Core method: fetch recent mistakes, call LLM to generate exercises,
         return a ReviewSession payload to be sent to Unity.
         """
-        # 1. Get top recurring categories
-        top_mistakes = await self._mistakes.get_top_mistakes(player_id, limit=3)
-        recent_mistakes = await self._mistakes.get_recent_mistakes(player_id, since_minutes=15)
+        # 1. Get top recurring categories and recent examples (independent queries)
+        top_mistakes, recent_mistakes = await asyncio.gather(
+            self._mistakes.get_top_mistakes(player_id, limit=3),
+            self._mistakes.get_recent_mistakes(player_id, since_minutes=15),
+        )
 
         if not top_mistakes:
             # No mistakes yet — return an empty session marker
@@ -71,30 +94,66 @@ class ReviewScheduler:
                 exercises=[],
             )
 
-        # 2. Build prompt context
-        mistake_summary = json.dumps(top_mistakes, indent=2)
-        mistake_examples = json.dumps(
-            [{"category": m["category"], "original": m["original"], "correction": m["correction"]}
-             for m in recent_mistakes[:10]],
-            indent=2,
+        # 2. One small LLM call per exercise, all in flight at once: the
+        # provider decodes them in parallel instead of 5 exercises back to back
+        categories = [m["category"] for m in top_mistakes]
+        focus = categories[:_MAX_CATEGORIES]
+        # (category, rising difficulty), cycling through the focus categories
+        plan = [
+            (focus[i % len(focus)], min(i + 1, _DIFFICULTY_SCALE))
+            for i in range(_EXERCISES_PER_SESSION)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._generate_exercise(category, difficulty, recent_mistakes)
+                for category, difficulty in plan
+            ),
+            return_exceptions=True,
         )
 
-        # 3. LLM generates the exercises
-        prompt = _REVIEW_GENERATION_PROMPT.format(
-            mistake_summary=mistake_summary,
-            mistake_examples=mistake_examples,
-        )
-        raw_session = await self._llm.complete(
-            system_prompt="You are a language review session generator. Always respond with valid JSON only.",
-            user_message=prompt,
-        )
-        session_data = json.loads(raw_session)
+        # 3. A failed exercise only shortens the session
+        exercises = []
+        for (category, difficulty), result in zip(plan, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Review exercise (%s, difficulty %d) failed for player %s: %s",
+                    category, difficulty, player_id, result,
+                )
+            else:
+                exercises.append(result)
 
         return ReviewSession(
             player_id=player_id,
-            top_mistake_categories=[m["category"] for m in top_mistakes],
-            exercises=session_data.get("exercises", []),
+            top_mistake_categories=categories,
+            exercises=exercises,
+        )
+
+    async def _generate_exercise(
+        self, category: str, difficulty: int, recent_mistakes: List[Dict[str, Any]]
+    ) -> ReviewExercise:
+        examples = orjson.dumps(
+            [{"original": m["original"], "correction": m["correction"]}
+             for m in recent_mistakes if m["category"] == category][:_EXAMPLES_PER_EXERCISE],
+            option=orjson.OPT_INDENT_2,
+        ).decode()
+        prompt = (
+            f"Mistake category: {category}\n"
+            f"Difficulty: {difficulty} of {_DIFFICULTY_SCALE}\n\n"
+            f"The student's recent mistakes in this category:\n{examples}"
         )
+        raw_exercise = await self._llm.complete(
+            system_prompt=_EXERCISE_SYSTEM_PROMPT,
+            user_message=prompt,
+            schema=_EXERCISE_SCHEMA,
+        )
+        try:
+            return _EXERCISE_DECODER.decode(raw_exercise)
+        except msgspec.DecodeError:
+            logger.warning(
+                "Dropping malformed review exercise (%s, difficulty %d): %r",
+                category, difficulty, raw_exercise,
+            )
+            raise
 
     async def should_trigger_review(self, player_id: str, active_minutes: int) -> bool:
         """
@@ -6,10 +6,14 @@ This manager processes them and updates the Redis world state store.
 
 No LLM or TTS involved — this is pure state management.
 """
-from typing import Any, Dict
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 
 from domain.interfaces.IRepositories import IWorldStateRepository
 
+logger = logging.getLogger(__name__)
+
 
 # Event type constants matching what Unity will send
 EVENT_PLAYER_MOVED = "PlayerMoved"
@@ -21,16 +25,23 @@ EVENT_SCENE_CHANGED = "SceneChanged"
 EVENT_DIALOGUE_STARTED = "DialogueStarted"
 EVENT_DIALOGUE_ENDED = "DialogueEnded"
 
+# Events that add to / remove from the nearby_npcs set rather than overwrite fields
+_PROXIMITY_EVENTS = (EVENT_PLAYER_ENTERED_PROXIMITY, EVENT_PLAYER_LEFT_PROXIMITY)
+
+# Events for one player arriving within this window are merged into one write
+_COALESCE_INTERVAL_SECONDS = 0.02
+
+# Per-player backlog cap; beyond it handle_event waits for the drainer
+_EVENT_QUEUE_MAXSIZE = 64
+
+# PlayerMoved only keeps the latest position, written for all players at this interval
+_POSITION_FLUSH_INTERVAL_SECONDS = 0.1
+
 
 class WorldStateManager:
     def __init__(self, world_state_repo: IWorldStateRepository):
         self._state = world_state_repo
-
-    async def handle_event(self, player_id: str, event_type: str, payload: Dict[str, Any]) -> None:
-        """
-        Dispatch a Unity game event to the appropriate state update handler.
-        """
-        handlers = {
+        self._handlers = {
             EVENT_PLAYER_MOVED: self._on_player_moved,
             EVENT_PLAYER_PICKED_OBJECT: self._on_picked_object,
             EVENT_PLAYER_DROPPED_OBJECT: self._on_dropped_object,
@@ -40,62 +51,153 @@ class WorldStateManager:
             EVENT_DIALOGUE_STARTED: self._on_dialogue_started,
             EVENT_DIALOGUE_ENDED: self._on_dialogue_ended,
         }
-        handler = handlers.get(event_type)
-        if handler:
-            await handler(player_id, payload)
+        # player_id → events waiting for that player's next coalesced write
+        self._event_queues: Dict[str, asyncio.Queue] = {}
+        self._drainers: set = set()
+        # player_id → latest PlayerMoved payload not yet written
+        self._pending_positions: Dict[str, Dict[str, Any]] = {}
+        self._position_flusher: Optional[asyncio.Task] = None
+
+    async def handle_event(self, player_id: str, event_type: str, payload: Dict[str, Any]) -> None:
+        """
+        Queue a Unity game event for the player's next state write and return.
+
+        Events are applied in arrival order; all events for a player within one
+        coalescing interval become a single Redis write (so a burst of
+        PlayerMoved events only stores the latest position). PlayerMoved is
+        further debounced: positions are written every
+        _POSITION_FLUSH_INTERVAL_SECONDS unless another event for the player
+        arrives first and carries the pending position along in order.
+        """
+        if event_type not in self._handlers:
+            return
+        if event_type == EVENT_PLAYER_MOVED:
+            self._pending_positions[player_id] = payload
+            if self._position_flusher is None:
+                self._position_flusher = asyncio.create_task(self._flush_positions())
+            return
+
+        queue = self._event_queues.get(player_id)
+        if queue is None:
+            queue = self._event_queues[player_id] = asyncio.Queue(maxsize=_EVENT_QUEUE_MAXSIZE)
+            drainer = asyncio.create_task(self._drain_player_events(player_id, queue))
+            self._drainers.add(drainer)
+            drainer.add_done_callback(self._drainers.discard)
+        pending_position = self._pending_positions.pop(player_id, None)
+        # Waits only when the player's backlog is full: a stalled Redis slows the
+        # sender down instead of growing the queue. The drainer never exits while
+        # the queue holds events, so a waiting put always completes.
+        if pending_position is not None:
+            await queue.put((EVENT_PLAYER_MOVED, pending_position))
+        await queue.put((event_type, payload))
 
     async def get_player_state(self, player_id: str) -> Dict[str, Any]:
         return await self._state.get_player_state(player_id)
 
+    async def shutdown(self) -> None:
+        """Wait for every queued event and pending position to be written."""
+        flushers = [self._position_flusher] if self._position_flusher else []
+        await asyncio.gather(*self._drainers, *flushers, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Coalescing
+    # ------------------------------------------------------------------
+
+    async def _drain_player_events(self, player_id: str, queue: asyncio.Queue) -> None:
+        while True:
+            await asyncio.sleep(_COALESCE_INTERVAL_SECONDS)
+            events: List[Tuple[str, Dict]] = []
+            while not queue.empty():
+                events.append(queue.get_nowait())
+            if not events:
+                # No await between the check and the removal, so no event can slip in
+                del self._event_queues[player_id]
+                return
+            try:
+                await self._apply_events(player_id, events)
+            except Exception:
+                logger.exception("Failed to apply %d events for player %s", len(events), player_id)
+
+    async def _flush_positions(self) -> None:
+        while True:
+            await asyncio.sleep(_POSITION_FLUSH_INTERVAL_SECONDS)
+            if not self._pending_positions:
+                self._position_flusher = None
+                return
+            positions, self._pending_positions = self._pending_positions, {}
+            try:
+                await self._state.update_player_states_bulk({
+                    player_id: self._on_player_moved(payload, {})
+                    for player_id, payload in positions.items()
+                })
+            except Exception:
+                logger.exception("Failed to write %d player positions", len(positions))
+
+    async def _apply_events(self, player_id: str, events: List[Tuple[str, Dict]]) -> None:
+        patch: Dict[str, Any] = {}
+        # npc_id → in proximity; applied as set ops unless the batch replaces the set
+        nearby_changes: Dict[str, bool] = {}
+        for event_type, payload in events:
+            if event_type in _PROXIMITY_EVENTS and "nearby_npcs" not in patch:
+                npc_id = payload.get("npc_id")
+                if npc_id:
+                    nearby_changes[npc_id] = event_type == EVENT_PLAYER_ENTERED_PROXIMITY
+                continue
+            patch.update(self._handlers[event_type](payload, patch))
+            if "nearby_npcs" in patch:
+                nearby_changes.clear()
+
+        # Disjoint keys (set ops only happen when the patch leaves the set alone)
+        writes = [
+            self._state.add_nearby_npc(player_id, npc_id) if entered
+            else self._state.remove_nearby_npc(player_id, npc_id)
+            for npc_id, entered in nearby_changes.items()
+        ]
+        if patch:
+            writes.append(self._state.update_player_state(player_id, patch))
+        await asyncio.gather(*writes)
+
     # ------------------------------------------------------------------
-    # Event Handlers
+    # Event Handlers: each returns the state fields the event changes
     # ------------------------------------------------------------------
 
-    async def _on_player_moved(self, player_id: str, payload: Dict) -> None:
-        await self._state.update_player_state(player_id, {
+    def _on_player_moved(self, payload: Dict, patch: Dict) -> Dict:
+        return {
             "position_x": payload.get("x", 0),
             "position_y": payload.get("y", 0),
             "position_z": payload.get("z", 0),
-        })
+        }
 
-    async def _on_picked_object(self, player_id: str, payload: Dict) -> None:
-        await self._state.update_player_state(player_id, {
-            "object_in_hand": payload.get("object_id"),
-        })
+    def _on_picked_object(self, payload: Dict, patch: Dict) -> Dict:
+        return {"object_in_hand": payload.get("object_id")}
 
-    async def _on_dropped_object(self, player_id: str, payload: Dict) -> None:
-        await self._state.update_player_state(player_id, {
-            "object_in_hand": None,
-        })
+    def _on_dropped_object(self, payload: Dict, patch: Dict) -> Dict:
+        return {"object_in_hand": None}
 
-    async def _on_entered_proximity(self, player_id: str, payload: Dict) -> None:
-        state = await self._state.get_player_state(player_id)
-        nearby = state.get("nearby_npcs", [])
+    # Only called once the batch has replaced nearby_npcs (after a SceneChanged);
+    # otherwise proximity events become SADD/SREM in _apply_events.
+    def _on_entered_proximity(self, payload: Dict, patch: Dict) -> Dict:
+        nearby = patch["nearby_npcs"]
         npc_id = payload.get("npc_id")
-        if npc_id and npc_id not in nearby:
-            nearby.append(npc_id)
-        await self._state.update_player_state(player_id, {"nearby_npcs": nearby})
+        if npc_id:
+            nearby.add(npc_id)
+        return {"nearby_npcs": nearby}
 
-    async def _on_left_proximity(self, player_id: str, payload: Dict) -> None:
-        state = await self._state.get_player_state(player_id)
-        nearby = state.get("nearby_npcs", [])
+    def _on_left_proximity(self, payload: Dict, patch: Dict) -> Dict:
         npc_id = payload.get("npc_id")
-        nearby = [n for n in nearby if n != npc_id]
-        await self._state.update_player_state(player_id, {"nearby_npcs": nearby})
+        nearby = patch["nearby_npcs"]
+        nearby.discard(npc_id)
+        return {"nearby_npcs": nearby}
 
-    async def _on_scene_changed(self, player_id: str, payload: Dict) -> None:
-        await self._state.update_player_state(player_id, {
+    def _on_scene_changed(self, payload: Dict, patch: Dict) -> Dict:
+        return {
             "scene_id": payload.get("scene_id"),
-            "nearby_npcs": [],          # Clear proximity on scene transition
+            "nearby_npcs": set(),       # Clear proximity on scene transition
             "object_in_hand": None,
-        })
+        }
 
-    async def _on_dialogue_started(self, player_id: str, payload: Dict) -> None:
-        await self._state.update_player_state(player_id, {
-            "active_npc_id": payload.get("npc_id"),
-        })
+    def _on_dialogue_started(self, payload: Dict, patch: Dict) -> Dict:
+        return {"active_npc_id": payload.get("npc_id")}
 
-    async def _on_dialogue_ended(self, player_id: str, payload: Dict) -> None:
-        await self._state.update_player_state(player_id, {
-            "active_npc_id": None,
-        })
+    def _on_dialogue_ended(self, payload: Dict, patch: Dict) -> Dict:
+        return {"active_npc_id": None}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional
 
 
 class ILargeLanguageModel(ABC):
@@ -8,13 +8,19 @@ class ILargeLanguageModel(ABC):
     """
 
     @abstractmethod
-    async def complete(self, system_prompt: str, user_message: str) -> str:
+    async def complete(
+        self, system_prompt: str, user_message: str,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         One-shot completion for structured outputs (e.g., grammar correction).
 
         Args:
             system_prompt: Instructions / persona context.
             user_message:  The player's input or query.
+            schema:        Optional JSON Schema for the reply. Backends with
+                           constrained decoding enforce it; the rest fall back
+                           to plain JSON mode.
 
         Returns:
             Complete response string.
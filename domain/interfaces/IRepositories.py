@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.models import GrammarMistake
 
 
 class IWorldStateRepository(ABC):
@@ -15,7 +17,25 @@ class IWorldStateRepository(ABC):
 
     @abstractmethod
     async def update_player_state(self, player_id: str, patch: Dict[str, Any]) -> None:
-        """Atomically merge the patch dict into the existing player state."""
+        """
+        Atomically merge the patch dict into the existing player state.
+        A "nearby_npcs" entry replaces the whole nearby set.
+        """
+        ...
+
+    @abstractmethod
+    async def update_player_states_bulk(self, patches: Dict[str, Dict[str, Any]]) -> None:
+        """Apply update_player_state for many players (player_id → patch) in one round trip."""
+        ...
+
+    @abstractmethod
+    async def add_nearby_npc(self, player_id: str, npc_id: str) -> None:
+        """Atomically add an NPC to the player's nearby set (no read needed)."""
+        ...
+
+    @abstractmethod
+    async def remove_nearby_npc(self, player_id: str, npc_id: str) -> None:
+        """Atomically remove an NPC from the player's nearby set."""
         ...
 
     @abstractmethod
@@ -27,9 +47,31 @@ class IWorldStateRepository(ABC):
 
     @abstractmethod
     async def append_conversation_turn(
-        self, player_id: str, npc_id: str, role: str, content: str
+        self, player_id: str, npc_id: str, role: str, content: str,
+        speaker: Optional[str] = None,
     ) -> None:
-        """Append a single dialogue turn to the conversation history list."""
+        """
+        Append a single dialogue turn to the conversation history list.
+        Also stores it pre-formatted as "SPEAKER: content" for prompt assembly
+        (speaker defaults to the upper-cased role).
+        """
+        ...
+
+    @abstractmethod
+    async def get_formatted_history(
+        self, player_id: str, npc_id: str, window: int = 10
+    ) -> List[str]:
+        """Return the last `window` turns as ready-to-prompt "SPEAKER: content" lines."""
+        ...
+
+    @abstractmethod
+    async def get_turn_context(
+        self, player_id: str, npc_id: str, window: int = 10
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Return (player state, last `window` formatted turns with the NPC) in a
+        single round trip. Equivalent to get_player_state + get_formatted_history.
+        """
         ...
 
 
@@ -44,6 +86,11 @@ class IMistakeRepository(ABC):
         """Persist a single grammar mistake event."""
         ...
 
+    @abstractmethod
+    async def log_mistakes(self, mistakes: List[GrammarMistake]) -> None:
+        """Persist many grammar mistake events in one round trip."""
+        ...
+
     @abstractmethod
     async def get_top_mistakes(
         self, player_id: str, limit: int = 3
@@ -25,15 +25,16 @@ class ISpeechToText(ABC):
     @abstractmethod
     async def transcribe_stream(
         self, audio_stream: AsyncGenerator[bytes, None], language: str = "en"
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[tuple[bool, str], None]:
         """
-        Transcribe a live audio stream, yielding partial text chunks as they arrive.
+        Transcribe a live audio stream, yielding transcripts as they arrive.
 
         Args:
             audio_stream: AsyncGenerator producing audio byte chunks.
             language:     BCP-47 language code.
 
         Yields:
-            Partial transcription strings.
+            (is_final, text) pairs. Final segments are committed and make up
+            the utterance; interim ones may still be revised by later results.
         """
         ...
@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+import msgspec
+
 
 @dataclass
 class PlayerPosition:
@@ -58,18 +60,51 @@ class GrammarMistake:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
-class GrammarCorrectionResult:
+class GrammarCorrectionResult(msgspec.Struct, frozen=True):
     """
     Structured output from the Grammar Correction LLM call.
-    Designed to map directly from JSON schema response.
+    Designed to map directly from JSON schema response
+    (decoded and validated in one pass with msgspec).
+    Frozen: cached results are shared between players.
+    Groq's JSON mode doesn't enforce the schema, so fields may arrive as null;
+    they are normalised to "" (severity to 1) on construction.
     """
     mistake_found: bool
-    category: str = ""
-    original: str = ""
-    correction: str = ""
-    explanation: str = ""
-    severity: int = 1
+    category: Optional[str] = None
+    original: Optional[str] = None
+    correction: Optional[str] = None
+    explanation: Optional[str] = None
+    severity: Optional[int] = None
+
+    def __post_init__(self):
+        for name in ("category", "original", "correction", "explanation"):
+            if getattr(self, name) is None:
+                msgspec.structs.force_setattr(self, name, "")
+        if self.severity is None:
+            msgspec.structs.force_setattr(self, "severity", 1)
+
+
+# JSON Schema of GrammarCorrectionResult, for LLM structured-output modes
+GRAMMAR_CORRECTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "mistake_found": {"type": "boolean"},
+        "category": {
+            "type": "string",
+            "enum": [
+                "verb_conjugation", "gender_agreement", "tense",
+                "vocabulary", "pronunciation_flag", "none",
+            ],
+        },
+        "original": {"type": "string"},
+        "correction": {"type": "string"},
+        "explanation": {"type": "string"},
+        "severity": {"type": "integer", "minimum": 1, "maximum": 5},
+    },
+    "required": [
+        "mistake_found", "category", "original", "correction", "explanation", "severity",
+    ],
+}
 
 
 @dataclass
@@ -79,12 +114,23 @@ class ConversationTurn:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+class ReviewExercise(msgspec.Struct, frozen=True):
+    """A single LLM-generated exercise; `options` is null unless multiple_choice."""
+    type: str
+    instruction: str
+    prompt: str
+    correct_answer: str
+    explanation: str = ""
+    # Groq doesn't enforce the schema, and the model often sends null here
+    options: Optional[List[str]] = None
+
+
+@dataclass(slots=True)
 class ReviewSession:
     """
     Generated review session payload sent to Unity to load the review scene.
     """
     player_id: str
     top_mistake_categories: List[str]
-    exercises: List[dict]  # List of dynamic exercise dicts generated by LLM
+    exercises: List[ReviewExercise]  # Exercises generated by the LLM
     generated_at: datetime = field(default_factory=datetime.utcnow)
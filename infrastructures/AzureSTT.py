@@ -7,7 +7,8 @@ Fast, accurate speech recognition with support for multiple languages.
 
 import os
 import asyncio
-from typing import AsyncGenerator
+from concurrent.futures import Executor
+from typing import AsyncGenerator, Optional
 
 import azure.cognitiveservices.speech as speechsdk
 
@@ -15,9 +16,12 @@ from domain.interfaces.ISpeechToText import ISpeechToText
 
 
 class AzureSTT(ISpeechToText):
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None):
         """
         Initialize Azure Speech Service for STT.
+
+        Args:
+            executor: Thread pool for the blocking SDK calls (None = loop default).
         
         Required env vars:
         - AZURE_SPEECH_KEY: Your Azure Speech service key
@@ -41,6 +45,7 @@ class AzureSTT(ISpeechToText):
             channels=1
         )
         
+        self._executor = executor
         print(f"[AzureSTT] Initialized with region: {speech_region}")
 
     def _transcribe_sync(self, audio_bytes: bytes, language: str) -> str:
@@ -109,9 +114,9 @@ class AzureSTT(ISpeechToText):
         
         print(f"[AzureSTT] Transcribing {len(audio_bytes)} bytes in {language}")
         
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None, self._transcribe_sync, audio_bytes, language
+            self._executor, self._transcribe_sync, audio_bytes, language
         )
         
         print(f"[AzureSTT] Result: '{result}'")
@@ -121,7 +126,7 @@ class AzureSTT(ISpeechToText):
         self,
         audio_stream: AsyncGenerator[bytes, None],
         language: str = "en"
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[tuple[bool, str], None]:
         """
         Streaming transcription (buffers and transcribes in chunks).
         
@@ -136,4 +141,4 @@ class AzureSTT(ISpeechToText):
         if buffer:
             text = await self.transcribe(bytes(buffer), language)
             if text:
-                yield text
+                yield True, text
@@ -8,19 +8,26 @@ Fast, reliable, and better quality than Google TTS.
 import os
 import asyncio
 import io
-from typing import AsyncGenerator
+from concurrent.futures import Executor
+from typing import AsyncGenerator, Optional
 
 import azure.cognitiveservices.speech as speechsdk
 
 from domain.interfaces.ITextToSpeech import ITextToSpeech
 
+# Characters that end a synthesizable phrase in synthesize_stream
+_PHRASE_END_CHARS = frozenset(".!?,")
+
 
 class AzureTTS(ITextToSpeech):
     _synthesizer_cache: dict  # voice_id -> SpeechSynthesizer
 
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None):
         """
         Initialize Azure Speech Service.
+
+        Args:
+            executor: Thread pool for the blocking SDK calls (None = loop default).
         
         Required env vars:
         - AZURE_SPEECH_KEY: Your Azure Speech service key
@@ -52,6 +59,7 @@ class AzureTTS(ITextToSpeech):
         )
         
         self._synthesizer_cache = {}
+        self._executor = executor
         print(f"[AzureTTS] Initialized with voice: {self.speech_config.speech_synthesis_voice_name}")
 
     def _get_synthesizer(self, voice_id: str = None) -> speechsdk.SpeechSynthesizer:
@@ -134,8 +142,8 @@ class AzureTTS(ITextToSpeech):
         Returns:
             WAV audio bytes (16kHz, 16-bit, mono)
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._generate_audio_bytes, text, voice_id)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._generate_audio_bytes, text, voice_id)
 
     async def synthesize_stream(
         self, text_stream: AsyncGenerator[str, None], voice_id: str = None
@@ -146,29 +154,32 @@ class AzureTTS(ITextToSpeech):
 
         Flushing at a character cap prevents Azure RTF timeouts on long sentences.
         """
-        buffer_parts = []
+        buffer = io.StringIO()
+        # Running length plus the newest character make the boundary test O(1)
+        # per chunk; the text is only read out when it is flushed
+        buffer_len = 0
         sentence_count = 0
         MAX_CHARS = 80  # flush before Azure's RTF threshold kicks in
 
         async for chunk in text_stream:
-            buffer_parts.append(chunk)
-            assembled = "".join(buffer_parts)
-
-            at_boundary = any(assembled.endswith(p) for p in (".", "!", "?", ","))
-            over_limit   = len(assembled) >= MAX_CHARS
+            if not chunk:
+                continue
+            buffer.write(chunk)
+            buffer_len += len(chunk)
 
-            if at_boundary or over_limit:
-                text_to_speak = assembled.strip()
+            if chunk[-1] in _PHRASE_END_CHARS or buffer_len >= MAX_CHARS:
+                text_to_speak = buffer.getvalue().strip()
                 if text_to_speak:
                     sentence_count += 1
                     print(f"[AzureTTS] Synthesizing chunk #{sentence_count} ({len(text_to_speak)} chars): '{text_to_speak[:60]}'")
                     audio_bytes = await self.synthesize(text_to_speak, voice_id)
                     print(f"[AzureTTS] Generated {len(audio_bytes)} bytes for chunk #{sentence_count}")
                     yield audio_bytes
-                buffer_parts = []
+                buffer = io.StringIO()
+                buffer_len = 0
 
         # Flush remainder
-        remainder = "".join(buffer_parts).strip()
+        remainder = buffer.getvalue().strip()
         if remainder:
             sentence_count += 1
             print(f"[AzureTTS] Synthesizing final chunk: '{remainder[:60]}'")
@@ -10,13 +10,16 @@ Env var: GOOGLE_API_KEY or GEMINI_API_KEY
 
 import os
 import asyncio
-from typing import AsyncGenerator
+import logging
+from typing import Any, AsyncGenerator, Dict, Optional
 
 from google import genai
 from google.genai.errors import ServerError
 
 from domain.interfaces.ILargeLanguageModel import ILargeLanguageModel
 
+logger = logging.getLogger(__name__)
+
 
 class GeminiLLM(ILargeLanguageModel):
     def __init__(self):
@@ -33,10 +36,10 @@ class GeminiLLM(ILargeLanguageModel):
         print(f"[GeminiLLM] Initialized with model: {self._model_name}")
 
     async def _retry_with_backoff(self, func, *args, max_retries=2, **kwargs):
-        """Retry API calls with exponential backoff for 503 errors."""
+        """Retry async API calls with exponential backoff for 503 errors."""
         for attempt in range(max_retries + 1):
             try:
-                return func(*args, **kwargs)
+                return await func(*args, **kwargs)
             except ServerError as e:
                 if e.status_code == 503 and attempt < max_retries:
                     wait_time = 2 ** attempt  # 1s, 2s, 4s...
@@ -45,20 +48,25 @@ class GeminiLLM(ILargeLanguageModel):
                 else:
                     raise
 
-    async def complete(self, system_prompt: str, user_message: str) -> str:
+    async def complete(
+        self, system_prompt: str, user_message: str,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         One-shot completion with structured output.
-        Used for grammar correction (JSON format).
+        Used for grammar correction (JSON format, schema-constrained when given).
         """
         prompt = f"{system_prompt}\n\nUser input: {user_message}"
         
+        # The client's aio surface: the HTTP round trip never blocks the event loop
         response = await self._retry_with_backoff(
-            self._client.models.generate_content,
+            self._client.aio.models.generate_content,
             model=self._model_name,
             contents=prompt,
             config=genai.types.GenerateContentConfig(
                 temperature=0.2,
                 response_mime_type="application/json",
+                response_schema=schema,
             )
         )
         
@@ -73,12 +81,12 @@ class GeminiLLM(ILargeLanguageModel):
         """
         prompt = f"{system_prompt}\n\nUser: {user_message}\nAssistant:"
         
-        print(f"[GeminiLLM] Starting streaming generation...")
+        logger.debug("[GeminiLLM] Starting streaming generation...")
         
         max_retries = 2
         for attempt in range(max_retries + 1):
             try:
-                response = self._client.models.generate_content_stream(
+                response = await self._client.aio.models.generate_content_stream(
                     model=self._model_name,
                     contents=prompt,
                     config=genai.types.GenerateContentConfig(
@@ -86,9 +94,10 @@ class GeminiLLM(ILargeLanguageModel):
                     )
                 )
                 
-                for chunk in response:
+                async for chunk in response:
                     if chunk.text:
-                        print(f"[GeminiLLM] Yielding chunk: '{chunk.text[:50]}...'")
+                        # Lazy %-args: nothing is formatted or written unless DEBUG is on
+                        logger.debug("[GeminiLLM] Yielding chunk: '%s...'", chunk.text[:50])
                         yield chunk.text
                 
                 # Successful completion, exit retry loop
@@ -133,10 +142,13 @@ class GeminiLLMConfigurable(ILargeLanguageModel):
         self._top_k = top_k
         self._max_output_tokens = max_output_tokens
 
-    async def complete(self, system_prompt: str, user_message: str) -> str:
+    async def complete(
+        self, system_prompt: str, user_message: str,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> str:
         prompt = f"{system_prompt}\n\nUser input: {user_message}"
         
-        response = self._client.models.generate_content(
+        response = await self._client.aio.models.generate_content(
             model=self._model_name,
             contents=prompt,
             config=genai.types.GenerateContentConfig(
@@ -145,6 +157,7 @@ class GeminiLLMConfigurable(ILargeLanguageModel):
                 top_k=self._top_k,
                 max_output_tokens=self._max_output_tokens,
                 response_mime_type="application/json",
+                response_schema=schema,
             )
         )
         
@@ -155,7 +168,7 @@ class GeminiLLMConfigurable(ILargeLanguageModel):
     ) -> AsyncGenerator[str, None]:
         prompt = f"{system_prompt}\n\nUser: {user_message}\nAssistant:"
         
-        response = self._client.models.generate_content_stream(
+        response = await self._client.aio.models.generate_content_stream(
             model=self._model_name,
             contents=prompt,
             config=genai.types.GenerateContentConfig(
@@ -166,6 +179,6 @@ class GeminiLLMConfigurable(ILargeLanguageModel):
             )
         )
         
-        for chunk in response:
+        async for chunk in response:
             if chunk.text:
                 yield chunk.text
@@ -6,28 +6,43 @@ Much faster than local Coqui TTS (~100-300ms per request).
 """
 
 import io
-import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 import httpx
 import base64
 import os
 
 from domain.interfaces.ITextToSpeech import ITextToSpeech
 
+# Characters that end a sentence in synthesize_stream
+_SENTENCE_END_CHARS = frozenset(".!?")
+
 
 class GoogleCloudTTS(ITextToSpeech):
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize Google Cloud TTS using REST API with API key.
         Uses the same GOOGLE_API_KEY as Gemini.
+        Pass a shared http_client to reuse pooled connections across requests.
         """
         self.api_key = os.getenv('GOOGLE_API_KEY')
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY must be set for Google Cloud TTS")
         
         self.base_url = "https://texttospeech.googleapis.com/v1/text:synthesize"
+        # Without a shared client, keep one of our own alive for every sentence:
+        # a fresh client per request would pay a TCP + TLS handshake each time
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_http:
+            await self._http.aclose()
 
-    def _generate_audio_bytes(self, text: str, voice_id: str = None) -> bytes:
+    async def _generate_audio_bytes(self, text: str, voice_id: str = None) -> bytes:
         """
         Generates audio bytes from text using Google Cloud TTS REST API.
         
@@ -55,14 +70,12 @@ class GoogleCloudTTS(ITextToSpeech):
             }
         }
         
-        # Make synchronous request
-        with httpx.Client() as client:
-            response = client.post(
-                f"{self.base_url}?key={self.api_key}",
-                json=payload,
-                timeout=10.0
-            )
-            response.raise_for_status()
+        response = await self._http.post(
+            f"{self.base_url}?key={self.api_key}",
+            json=payload,
+            timeout=10.0
+        )
+        response.raise_for_status()
         
         # Extract audio content (base64 encoded)
         audio_base64 = response.json()["audioContent"]
@@ -81,8 +94,7 @@ class GoogleCloudTTS(ITextToSpeech):
         Returns:
             WAV audio bytes
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._generate_audio_bytes, text, voice_id)
+        return await self._generate_audio_bytes(text, voice_id)
 
     async def synthesize_stream(
         self, text_stream: AsyncGenerator[str, None], voice_id: str = None
@@ -93,20 +105,22 @@ class GoogleCloudTTS(ITextToSpeech):
         
         This allows Unity to start playing audio before the full response is complete.
         """
-        buffer_parts = []
+        buffer = io.StringIO()
 
         async for chunk in text_stream:
-            buffer_parts.append(chunk)
-            assembled = "".join(buffer_parts)
+            if not chunk:
+                continue
+            buffer.write(chunk)
 
-            # Yield at sentence boundaries for faster playback
-            if any(assembled.endswith(p) for p in (".", "!", "?")):
-                audio_bytes = await self.synthesize(assembled, voice_id)
+            # Yield at sentence boundaries for faster playback (only the newest
+            # character can complete one, so the text is read out on flush only)
+            if chunk[-1] in _SENTENCE_END_CHARS:
+                audio_bytes = await self.synthesize(buffer.getvalue(), voice_id)
                 yield audio_bytes
-                buffer_parts = []
+                buffer = io.StringIO()
 
         # Flush remainder
-        remainder = "".join(buffer_parts).strip()
+        remainder = buffer.getvalue().strip()
         if remainder:
             audio_bytes = await self.synthesize(remainder, voice_id)
             yield audio_bytes
@@ -9,16 +9,16 @@ Env var: GROQ_API_KEY
 """
 
 import os
-import asyncio
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional
 
-from groq import Groq
+import httpx
+from groq import AsyncGroq
 
 from domain.interfaces.ILargeLanguageModel import ILargeLanguageModel
 
 
 class GroqLLM(ILargeLanguageModel):
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         api_key = os.environ.get("GROQ_API_KEY")
         if not api_key:
             raise ValueError(
@@ -26,7 +26,8 @@ class GroqLLM(ILargeLanguageModel):
                 "Get a free key at https://console.groq.com"
             )
         
-        self._client = Groq(api_key=api_key)
+        # Native async client; a shared pooled http_client keeps TLS connections warm
+        self._client = AsyncGroq(api_key=api_key, http_client=http_client)
         
         # Default to fast Llama model (extremely fast inference)
         # Options: llama-3.3-70b-versatile, llama-3.1-70b-versatile, 
@@ -34,28 +35,29 @@ class GroqLLM(ILargeLanguageModel):
         self._model_name = os.environ.get("GROQ_MODEL", "llama-3.3-70b-versatile")
         print(f"[GroqLLM] Initialized with model: {self._model_name}")
 
-    async def complete(self, system_prompt: str, user_message: str) -> str:
+    async def complete(
+        self, system_prompt: str, user_message: str,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         One-shot completion with JSON output.
         Used for grammar correction.
+
+        `schema` is not sent: the default Llama models only support JSON mode,
+        which already guarantees a parseable object.
         """
         print(f"[GroqLLM] Generating completion (JSON mode)...")
         
-        loop = asyncio.get_event_loop()
-        
-        def _sync_complete():
-            response = self._client.chat.completions.create(
-                model=self._model_name,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.2,
-                response_format={"type": "json_object"}
-            )
-            return response.choices[0].message.content.strip()
-        
-        result = await loop.run_in_executor(None, _sync_complete)
+        response = await self._client.chat.completions.create(
+            model=self._model_name,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=0.2,
+            response_format={"type": "json_object"}
+        )
+        result = response.choices[0].message.content.strip()
         print(f"[GroqLLM] Completion result: '{result[:100]}...'")
         return result
 
@@ -70,34 +72,24 @@ class GroqLLM(ILargeLanguageModel):
         """
         print(f"[GroqLLM] Starting streaming generation...")
         
-        loop = asyncio.get_event_loop()
-        
-        # Create iterator in executor to avoid blocking
-        def _create_stream():
-            return self._client.chat.completions.create(
-                model=self._model_name,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.8,
-                stream=True
-            )
-        
-        stream = await loop.run_in_executor(None, _create_stream)
+        stream = await self._client.chat.completions.create(
+            model=self._model_name,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=0.8,
+            stream=True
+        )
         
         chunk_count = 0
-        # Wrap synchronous iterator to yield control to event loop
-        # This prevents blocking while TTS is generating audio
-        for chunk in stream:
+        # Async iteration awaits the socket, so TTS keeps running between chunks
+        async for chunk in stream:
             if chunk.choices[0].delta.content:
                 chunk_count += 1
                 text = chunk.choices[0].delta.content
                 if chunk_count <= 3 or chunk_count % 10 == 0:
                     print(f"[GroqLLM] Chunk #{chunk_count}: '{text[:30]}...'")
                 yield text
-                # Yield control to event loop after each chunk
-                # This allows TTS to process sentences concurrently
-                await asyncio.sleep(0)
         
         print(f"[GroqLLM] Stream complete. Total chunks: {chunk_count}")
@@ -6,41 +6,62 @@ Supports streaming and one-shot generation.
 """
 
 import os
-from typing import AsyncGenerator
+import socket
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Optional
 
 import httpx
+import orjson
 
 from domain.interfaces.ILargeLanguageModel import ILargeLanguageModel
 
 
 class OllamaLLM(ILargeLanguageModel):
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self._base_url = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
         self._model = os.environ.get("OLLAMA_MODEL", "llama3")
+        # Reused across calls so keep-alive connections survive between turns
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(max_keepalive_connections=20),
+                # Streamed tokens are a few bytes each; don't let Nagle batch them
+                socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+            ),
+        )
 
-    async def complete(self, system_prompt: str, user_message: str) -> str:
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def complete(
+        self, system_prompt: str, user_message: str,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         One-shot completion.
-        Used for grammar correction (JSON output).
+        Used for grammar correction (JSON output); a schema is enforced by
+        Ollama's structured outputs.
         """
-        async with httpx.AsyncClient(timeout=120) as client:
-            response = await client.post(
-                f"{self._base_url}/api/generate",
-                json={
-                    "model": self._model,
-                    "prompt": self._build_prompt(system_prompt, user_message),
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.2,
-                    },
-                    # Forces JSON-like structured output (best-effort)
-                    "format": "json",
+        response = await self._http.post(
+            f"{self._base_url}/api/generate",
+            json={
+                "model": self._model,
+                "prompt": self._build_prompt(system_prompt, user_message),
+                "stream": False,
+                "options": {
+                    "temperature": 0.2,
                 },
-            )
+                # Schema-constrained when given, otherwise plain JSON mode
+                "format": schema or "json",
+            },
+            timeout=120,
+        )
 
-            response.raise_for_status()
-            data = response.json()
-            return data.get("response", "").strip()
+        response.raise_for_status()
+        data = response.json()
+        return data.get("response", "").strip()
 
     async def stream_complete(
         self, system_prompt: str, user_message: str
@@ -49,31 +70,46 @@ class OllamaLLM(ILargeLanguageModel):
         Streaming completion.
         Used for NPC conversation replies piped to TTS.
         """
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream(
-                "POST",
-                f"{self._base_url}/api/generate",
-                json={
-                    "model": self._model,
-                    "prompt": self._build_prompt(system_prompt, user_message),
-                    "stream": True,
-                    "options": {
-                        "temperature": 0.8,
-                    },
+        async with self._http.stream(
+            "POST",
+            f"{self._base_url}/api/generate",
+            json={
+                "model": self._model,
+                "prompt": self._build_prompt(system_prompt, user_message),
+                "stream": True,
+                "options": {
+                    "temperature": 0.8,
                 },
-            ) as response:
+            },
+            # No read timeout mid-generation, but fail fast if Ollama is down
+            timeout=httpx.Timeout(None, connect=10.0),
+        ) as response:
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                async for line in response.aiter_lines():
+            # Split NDJSON on raw bytes: orjson parses bytes directly, so each
+            # line skips the str decode and httpx's line assembler
+            buffer = bytearray()
+            async for raw in response.aiter_bytes():
+                buffer += raw
+                start = 0
+                while (end := buffer.find(b"\n", start)) != -1:
+                    line = buffer[start:end]
+                    start = end + 1
                     if not line.strip():
                         continue
 
-                    data = httpx.Response(200, content=line).json()
-                    chunk = data.get("response")
+                    chunk = orjson.loads(line).get("response")
 
                     if chunk:
                         yield chunk
+                del buffer[:start]
+
+            # A final line without a trailing newline
+            if buffer.strip():
+                chunk = orjson.loads(buffer).get("response")
+                if chunk:
+                    yield chunk
 
     def _build_prompt(self, system_prompt: str, user_message: str) -> str:
         """
@@ -81,8 +117,10 @@ class OllamaLLM(ILargeLanguageModel):
         Ollama does not use ChatCompletion-style role messages,
         so we manually structure it.
         """
-        return (
-            f"### System:\n{system_prompt}\n\n"
-            f"### User:\n{user_message}\n\n"
-            f"### Assistant:\n"
-        )
\ No newline at end of file
+        return _prompt_prefix(system_prompt) + user_message + "\n\n### Assistant:\n"
+
+
+@lru_cache(maxsize=32)
+def _prompt_prefix(system_prompt: str) -> str:
+    # System prompts repeat across calls (grammar/review ones are static)
+    return f"### System:\n{system_prompt}\n\n### User:\n"
\ No newline at end of file
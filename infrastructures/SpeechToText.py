@@ -6,8 +6,10 @@ Uses faster-whisper for improved speed.
 """
 
 import io
+import os
 import asyncio
-from typing import AsyncGenerator
+from concurrent.futures import Executor
+from typing import AsyncGenerator, Optional
 
 import numpy as np
 import soundfile as sf
@@ -15,38 +17,77 @@ from faster_whisper import WhisperModel
 
 from domain.interfaces.ISpeechToText import ISpeechToText
 
+# CTranslate2 quantization per device: int8 on CPU, int8 weights + fp16 on CUDA
+_DEFAULT_COMPUTE_TYPES = {
+    "cpu": "int8",
+    "cuda": "int8_float16",
+}
+
 
 class WhisperSTT(ISpeechToText):
-    def __init__(self):
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        model_size: Optional[str] = None,
+        device: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        cpu_threads: Optional[int] = None,
+        num_workers: Optional[int] = None,
+        samples_per_flush: int = 16000,
+    ):
+        # Inference runs on this pool (None = the event loop's default executor)
+        self._executor = executor
+        # Streaming input is raw PCM16 at 16 kHz mono, so 16000 samples = 1 s
+        self._flush_bytes = samples_per_flush * 2
         # Model sizes: tiny, base, small, medium, large-v3
         # For dev: "small" is good balance
+        model_size = model_size or os.environ.get("WHISPER_MODEL", "small")
+        device = device or os.environ.get("WHISPER_DEVICE", "cpu")
+        # int8 weights halve memory traffic vs float; on GPU keep float16 activations
+        compute_type = compute_type or os.environ.get(
+            "WHISPER_COMPUTE_TYPE", _DEFAULT_COMPUTE_TYPES.get(device, "int8")
+        )
+        # CTranslate2 otherwise uses only a few intra-op threads; use every core.
+        # Two workers let a streaming chunk and a one-shot transcribe overlap.
+        cpu_threads = cpu_threads or int(
+            os.environ.get("WHISPER_CPU_THREADS", os.cpu_count() or 1)
+        )
+        num_workers = num_workers or int(os.environ.get("WHISPER_NUM_WORKERS", 2))
         self._model = WhisperModel(
-            "small",
-            device="cpu",       # change to "cuda" if GPU available
-            compute_type="int8" # faster CPU inference
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
         )
 
-    def _transcribe_sync(self, audio_bytes: bytes, language: str) -> str:
+    def _decode_audio(self, audio_bytes: bytes) -> np.ndarray:
         # Convert raw PCM16 bytes to numpy audio
         # Unity sends raw PCM16 (16-bit signed integers, mono, 16000 Hz)
         try:
             # First try to read as a file format (WAV, etc.)
+            # float32 is what Whisper consumes; soundfile's float64 default
+            # would double the bytes moved for no precision gain
             audio_buffer = io.BytesIO(audio_bytes)
-            audio, sr = sf.read(audio_buffer)
+            audio, sr = sf.read(audio_buffer, dtype="float32")
         except:
             # If that fails, assume raw PCM16 data from Unity
             print("[WhisperSTT] Treating as raw PCM16 data (16kHz mono)")
             # PCM16 = 16-bit signed integers = int16
             audio = np.frombuffer(audio_bytes, dtype=np.int16)
-            # Normalize to [-1.0, 1.0] float range (required by Whisper)
-            audio = audio.astype(np.float32) / 32768.0
+            # Normalize to [-1.0, 1.0] float range (required by Whisper), in place
+            audio = audio.astype(np.float32)
+            audio *= np.float32(1 / 32768.0)
             sr = 16000  # Unity sends at 16kHz
 
-        if len(audio.shape) > 1:
-            audio = np.mean(audio, axis=1)
+        if audio.ndim > 1:
+            # Down-mix to mono, accumulating in float32 rather than float64
+            audio = audio.mean(axis=1, dtype=np.float32)
+        return audio
 
+    def _transcribe_sync(self, audio_bytes: bytes, language: str) -> str:
         segments, _ = self._model.transcribe(
-            audio,
+            self._decode_audio(audio_bytes),
             language=language,
             beam_size=5
         )
@@ -54,38 +95,72 @@ class WhisperSTT(ISpeechToText):
         transcript = " ".join([segment.text for segment in segments])
         return transcript.strip()
 
+    def _transcribe_chunk_sync(
+        self, audio_bytes: bytes, language: str, previous_text: Optional[str]
+    ) -> str:
+        """
+        Cheaper decode for ~1 s streaming chunks: greedy search (beam width is
+        the main CPU cost and barely matters on short chunks), VAD to skip the
+        silence that often triggers a flush, and the previous chunk's text as a
+        prompt instead of conditioning on decoded tokens.
+        """
+        segments, _ = self._model.transcribe(
+            self._decode_audio(audio_bytes),
+            language=language,
+            beam_size=1,
+            vad_filter=True,
+            condition_on_previous_text=False,
+            initial_prompt=previous_text,
+        )
+
+        transcript = " ".join([segment.text for segment in segments])
+        return transcript.strip()
+
     async def transcribe(self, audio_bytes: bytes, language: str = "en") -> str:
         """
         Transcribe complete audio buffer.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, self._transcribe_sync, audio_bytes, language
+            self._executor, self._transcribe_sync, audio_bytes, language
         )
 
     async def transcribe_stream(
         self,
         audio_stream: AsyncGenerator[bytes, None],
-        language: str = "en"    ) -> AsyncGenerator[str, None]:
+        language: str = "en"    ) -> AsyncGenerator[tuple[bool, str], None]:
         """
         Simulated streaming transcription.
         Buffers audio until pause threshold and transcribes.
         """
 
+        loop = asyncio.get_running_loop()
         buffer = bytearray()
+        previous_text: Optional[str] = None
 
         async for chunk in audio_stream:
             buffer.extend(chunk)
 
-            # simple threshold flush (~1 second of audio)
-            if len(buffer) > 32000:
-                transcript = await self.transcribe(bytes(buffer), language)
+            # Flush in exact 1 s slices of whole samples; an odd trailing byte
+            # can't be read as int16, so it waits for the next chunk. An empty
+            # chunk from the producer forces out whatever is buffered.
+            while len(buffer) >= self._flush_bytes or (not chunk and len(buffer) > 1):
+                cut = min(self._flush_bytes, len(buffer) & ~1)
+                transcript = await loop.run_in_executor(
+                    self._executor, self._transcribe_chunk_sync,
+                    bytes(buffer[:cut]), language, previous_text,
+                )
+                del buffer[:cut]
                 if transcript:
-                    yield transcript
-                buffer.clear()
+                    previous_text = transcript
+                    yield True, transcript
 
         # flush remaining
+        del buffer[len(buffer) & ~1:]
         if buffer:
-            transcript = await self.transcribe(bytes(buffer), language)
+            transcript = await loop.run_in_executor(
+                self._executor, self._transcribe_chunk_sync,
+                bytes(buffer), language, previous_text,
+            )
             if transcript:
-                yield transcript
\ No newline at end of file
+                yield True, transcript
\ No newline at end of file
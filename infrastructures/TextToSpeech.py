@@ -7,7 +7,9 @@ Generates WAV audio bytes for Unity playback.
 
 import io
 import asyncio
-from typing import AsyncGenerator
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncGenerator, Optional
 
 import numpy as np
 import soundfile as sf
@@ -15,36 +17,75 @@ from TTS.api import TTS
 
 from domain.interfaces.ITextToSpeech import ITextToSpeech
 
+# Characters that end a synthesizable phrase in synthesize_stream
+_PHRASE_END_CHARS = frozenset(".!?,;")
 
-class CoquiTTS(ITextToSpeech):
-    def __init__(self):
-        # You can change model if needed
-        self._model_name = "tts_models/en/ljspeech/tacotron2-DDC"
-        self._tts = TTS(self._model_name)
-        self._sample_rate = 22050
+# You can change model if needed
+_MODEL_NAME = "tts_models/en/ljspeech/tacotron2-DDC"
+_SAMPLE_RATE = 22050
 
-    def _generate_wav_bytes(self, text: str) -> bytes:
-        """
-        Generates WAV bytes from text.
-        """
-        wav = self._tts.tts(text)
+# The model owned by this process (one per TTS worker process)
+_worker_tts: Optional[TTS] = None
+
+
+def _init_tts_worker(model_name: str) -> None:
+    """Process-pool initializer: load the model once per worker, before any request."""
+    global _worker_tts
+    _worker_tts = TTS(model_name)
+
+
+def _generate_wav_bytes(text: str, model_name: str) -> bytes:
+    """
+    Generates WAV bytes from text. Module-level so it can run in a worker process.
+    """
+    if _worker_tts is None:
+        # Thread-pool executors have no initializer hook
+        _init_tts_worker(model_name)
+    wav = _worker_tts.tts(text)
 
-        # Convert to numpy array
-        wav = np.array(wav)
+    # Convert to numpy array (no copy if it already is float32)
+    wav = np.asarray(wav, dtype=np.float32)
 
-        # Write to in-memory buffer
-        buffer = io.BytesIO()
-        sf.write(buffer, wav, self._sample_rate, format="WAV")
-        buffer.seek(0)
+    # Write to in-memory buffer as 16-bit PCM: half the bytes of the PCM_24
+    # default for float input, and what Unity plays anyway
+    buffer = io.BytesIO()
+    sf.write(buffer, wav, _SAMPLE_RATE, format="WAV", subtype="PCM_16")
+
+    return buffer.getvalue()
+
+
+class CoquiTTS(ITextToSpeech):
+    def __init__(self, executor: Optional[Executor] = None, workers: int = 2):
+        """
+        Args:
+            executor: Pool to run inference on. By default CoquiTTS starts its
+                      own pool of `workers` processes, each with the model
+                      preloaded, so the Python-level text/phoneme work never
+                      holds this process's GIL.
+        """
+        self._model_name = _MODEL_NAME
+        self._owns_executor = executor is None
+        # spawn, not fork: torch state in this process is not fork-safe
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_tts_worker,
+            initargs=(self._model_name,),
+        )
 
-        return buffer.read()
+    def close(self) -> None:
+        """Stop the worker processes if this instance started them."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
     async def synthesize(self, text: str, voice_id: str = None) -> bytes:
         """
         One-shot synthesis — returns complete WAV audio bytes.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._generate_wav_bytes, text)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, _generate_wav_bytes, text, self._model_name
+        )
 
     async def synthesize_stream(
         self, text_stream: AsyncGenerator[str, None], voice_id: str = None
@@ -53,19 +94,21 @@ class CoquiTTS(ITextToSpeech):
         Simulated streaming:
         Buffers text until sentence boundary, generates WAV, yields bytes.
         """
-        buffer_parts = []
+        buffer = io.StringIO()
 
         async for chunk in text_stream:
-            buffer_parts.append(chunk)
-            assembled = "".join(buffer_parts)
+            if not chunk:
+                continue
+            buffer.write(chunk)
 
-            if any(assembled.endswith(p) for p in (".", "!", "?", ",", ";")):
-                wav_bytes = await self.synthesize(assembled)
+            # Only the newest character can complete a phrase: read out on flush only
+            if chunk[-1] in _PHRASE_END_CHARS:
+                wav_bytes = await self.synthesize(buffer.getvalue())
                 yield wav_bytes
-                buffer_parts = []
+                buffer = io.StringIO()
 
         # Flush remainder
-        remainder = "".join(buffer_parts).strip()
+        remainder = buffer.getvalue().strip()
         if remainder:
             wav_bytes = await self.synthesize(remainder)
             yield wav_bytes
\ No newline at end of file
@@ -1,9 +1,12 @@
+import asyncio
 import os
 from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 from typing import Optional, Dict, List, Any
 import logging
 import ssl
+import threading
+from urllib.parse import urlsplit
 
 import asyncpg
 
@@ -14,6 +17,9 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Guards first-time construction when several threads reach the singleton at once
+_init_lock = threading.Lock()
+
 
 class SupabaseConnection:
     """
@@ -26,7 +32,9 @@ class SupabaseConnection:
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(SupabaseConnection, cls).__new__(cls)
+            with _init_lock:
+                if cls._instance is None:
+                    cls._instance = super(SupabaseConnection, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
@@ -35,6 +43,12 @@ class SupabaseConnection:
     
     def _initialize_client(self):
         """Initialize Supabase client using NEW authentication system (Publishable/Secret keys)."""
+        with _init_lock:
+            # Another thread may have built the client while we waited
+            if self._client is None:
+                self._create_client()
+
+    def _create_client(self):
         try:
             url = os.getenv('SUPABASE_URL')
             
@@ -202,31 +216,77 @@ def get_supabase_client() -> Client:
 
 
 _pg_pool: asyncpg.Pool | None = None
+# Serialises first-time pool creation so concurrent callers can't each build one
+_pg_pool_lock = asyncio.Lock()
+
+# Supabase's PgBouncer transaction-mode endpoint
+_TRANSACTION_POOLER_PORT = 6543
+
+
+def _uses_transaction_pooler(dsn: str) -> bool:
+    """
+    True when the DSN targets PgBouncer in transaction mode (port 6543, or
+    PG_TRANSACTION_POOLER=1). Connections there must hold no session state:
+    no SET, LISTEN or named prepared statements.
+    """
+    flag = os.environ.get("PG_TRANSACTION_POOLER")
+    if flag is not None:
+        return flag.lower() in ("1", "true", "yes")
+    try:
+        return urlsplit(dsn).port == _TRANSACTION_POOLER_PORT
+    except ValueError:
+        return False
 
 
 async def get_postgres_pool() -> asyncpg.Pool:
     global _pg_pool
-    if _pg_pool is None:
-        try:
-            # Create SSL context for Supabase connection
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            logger.info(f"Connecting to Supabase PostgreSQL: {os.environ.get('SUPABASE_DB_URL', 'NOT SET')[:50]}...")
-            
-            _pg_pool = await asyncpg.create_pool(
-                dsn=os.environ["SUPABASE_DB_URL"],
-                min_size=2,
-                max_size=10,
-                command_timeout=10,
-                ssl=ssl_context,              # Use SSL context with relaxed verification
-                statement_cache_size=0,       # Required for PgBouncer transaction pooler
-            )
-            logger.info("✅ PostgreSQL pool created successfully")
-        except Exception as e:
-            logger.error(f"❌ Failed to create PostgreSQL pool: {e}")
-            raise
+    if _pg_pool is not None:
+        return _pg_pool
+    async with _pg_pool_lock:
+        if _pg_pool is None:
+            try:
+                # Create SSL context for Supabase connection
+                ssl_context = ssl.create_default_context()
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+
+                logger.info(f"Connecting to Supabase PostgreSQL: {os.environ.get('SUPABASE_DB_URL', 'NOT SET')[:50]}...")
+
+                # Pool sizing is tunable per deployment; recycling connections after
+                # max_queries or idle_lifetime keeps them from going stale behind PgBouncer.
+                # Behind a transaction pooler PgBouncer already multiplexes server
+                # connections, so a small app-side pool is enough and avoids double pooling.
+                pooled = _uses_transaction_pooler(os.environ["SUPABASE_DB_URL"])
+                min_size = int(os.environ.get("PG_POOL_MIN", 1 if pooled else 5))
+                max_size = int(os.environ.get("PG_POOL_MAX", 4 if pooled else 20))
+                max_queries = int(os.environ.get("PG_POOL_MAX_QUERIES", 10_000))
+                idle_lifetime = float(os.environ.get("PG_POOL_IDLE_LIFETIME", 300.0))
+                logger.info(
+                    "PostgreSQL pool: min_size=%d max_size=%d max_queries=%d idle_lifetime=%.0fs",
+                    min_size, max_size, max_queries, idle_lifetime,
+                )
+
+                _pg_pool = await asyncpg.create_pool(
+                    dsn=os.environ["SUPABASE_DB_URL"],
+                    min_size=min_size,
+                    max_size=max_size,
+                    max_queries=max_queries,
+                    max_inactive_connection_lifetime=idle_lifetime,
+                    command_timeout=10,
+                    ssl=ssl_context,              # Use SSL context with relaxed verification
+                    statement_cache_size=0,       # Required for PgBouncer transaction pooler
+                    # Every query is re-planned (no statement cache), so JIT compilation
+                    # would only add warm-up time to our short OLTP queries. PgBouncer in
+                    # transaction mode rejects untracked startup parameters like jit, so
+                    # there set it on the role instead: ALTER ROLE ... SET jit = off
+                    server_settings=None if pooled else {
+                        "jit": "off", "application_name": "virtulingo",
+                    },
+                )
+                logger.info("✅ PostgreSQL pool created successfully")
+            except Exception as e:
+                logger.error(f"❌ Failed to create PostgreSQL pool: {e}")
+                raise
     return _pg_pool
 
 
@@ -18,11 +18,15 @@ Event Types:
 - context_change: Fired when scene/context changes
 """
 import asyncio
-from typing import Dict, List, Callable, Any
-from collections import defaultdict
+import logging
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Callable, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class Event:
@@ -47,10 +51,14 @@ class EventBus:
     """
     
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self._global_subscribers: List[Callable] = []
-        self._event_history: List[Event] = []  # For debugging/replay
+        # Handler tuples are replaced, never mutated, on (un)subscribe, so
+        # publish can iterate them without a lookup-then-copy on every event
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
+        self._global_subscribers: Tuple[Callable, ...] = ()
         self._max_history = 1000
+        # For debugging/replay; the deque drops the oldest event itself
+        self._event_history: Deque[Event] = deque(maxlen=self._max_history)
+        self._deliveries: Set[asyncio.Future] = set()  # Keeps in-flight fan-outs referenced
     
     def subscribe(self, topic: str, callback: Callable) -> None:
         """
@@ -60,7 +68,7 @@ class EventBus:
             topic: Event topic to subscribe to (e.g., "grammar_correction")
             callback: Async function to call when event is published
         """
-        self._subscribers[topic].append(callback)
+        self._subscribers[topic] = (*self._subscribers.get(topic, ()), callback)
     
     def subscribe_all(self, callback: Callable) -> None:
         """
@@ -70,12 +78,19 @@ class EventBus:
         Args:
             callback: Async function to call for every event
         """
-        self._global_subscribers.append(callback)
+        self._global_subscribers = (*self._global_subscribers, callback)
     
     def unsubscribe(self, topic: str, callback: Callable) -> None:
         """Remove a subscriber from a topic."""
-        if topic in self._subscribers and callback in self._subscribers[topic]:
-            self._subscribers[topic].remove(callback)
+        handlers = self._subscribers.get(topic, ())
+        if callback not in handlers:
+            return
+        remaining = list(handlers)
+        remaining.remove(callback)
+        if remaining:
+            self._subscribers[topic] = tuple(remaining)
+        else:
+            del self._subscribers[topic]
     
     async def publish(
         self,
@@ -88,7 +103,9 @@ class EventBus:
         Publish an event to a topic.
         
         All subscribers to this topic will be notified asynchronously.
-        Handlers are executed concurrently (fire-and-forget).
+        Handlers are executed concurrently (fire-and-forget): publish returns
+        without waiting for them, so a slow subscriber (e.g. a WebSocket write)
+        never holds up the publisher.
         
         Args:
             topic: Event topic (e.g., "grammar", "conversation", "movement")
@@ -105,23 +122,20 @@ class EventBus:
         
         # Store in history
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
-        
-        # Notify topic-specific subscribers
-        handlers = []
-        
-        if topic in self._subscribers:
-            for callback in self._subscribers[topic]:
-                handlers.append(callback(event))
         
-        # Notify global subscribers
-        for callback in self._global_subscribers:
-            handlers.append(callback(event))
+        subs = self._subscribers.get(topic, ())
+        global_subs = self._global_subscribers
+        if not subs and not global_subs:
+            return
         
         # Execute all handlers concurrently (non-blocking)
-        if handlers:
-            await asyncio.gather(*handlers, return_exceptions=True)
+        delivery = asyncio.gather(
+            *(callback(event) for callback in subs),
+            *(callback(event) for callback in global_subs),
+            return_exceptions=True,
+        )
+        self._deliveries.add(delivery)
+        delivery.add_done_callback(self._deliveries.discard)
     
     async def publish_and_wait(
         self,
@@ -143,20 +157,16 @@ class EventBus:
             metadata=metadata or {},
         )
         
-        handlers = []
-        
-        if topic in self._subscribers:
-            for callback in self._subscribers[topic]:
-                handlers.append(callback(event))
+        subs = self._subscribers.get(topic, ())
+        global_subs = self._global_subscribers
+        if not subs and not global_subs:
+            return []
         
-        for callback in self._global_subscribers:
-            handlers.append(callback(event))
-        
-        if handlers:
-            results = await asyncio.gather(*handlers, return_exceptions=True)
-            return results
-        
-        return []
+        return await asyncio.gather(
+            *(callback(event) for callback in subs),
+            *(callback(event) for callback in global_subs),
+            return_exceptions=True,
+        )
     
     def get_recent_events(self, topic: str = None, limit: int = 100) -> List[Event]:
         """
@@ -169,17 +179,25 @@ class EventBus:
         Returns:
             List of recent events
         """
-        events = self._event_history
+        events = reversed(self._event_history)
         
         if topic:
-            events = [e for e in events if e.topic == topic]
+            events = (e for e in events if e.topic == topic)
         
-        return events[-limit:]
+        # Walk back from the newest so a topic filter stops after `limit` hits
+        recent = list(islice(events, limit))
+        recent.reverse()
+        return recent
     
     def clear_history(self) -> None:
         """Clear event history (useful for tests)."""
         self._event_history.clear()
 
+    async def shutdown(self) -> None:
+        """Wait for in-flight fan-outs from publish() to finish."""
+        if self._deliveries:
+            await asyncio.gather(*self._deliveries, return_exceptions=True)
+
 
 class RedisEventBus(EventBus):
     """
@@ -191,12 +209,20 @@ class RedisEventBus(EventBus):
     - At-least-once delivery guarantees
     
     Requires: redis-py with asyncio support
+
+    XADDs are buffered and flushed together in one pipeline every
+    FLUSH_INTERVAL_SECONDS, so a burst of events costs one round trip.
     """
+
+    FLUSH_INTERVAL_SECONDS = 0.005
+    STREAM_MAXLEN = 10000
     
     def __init__(self, redis_client):
         super().__init__()
         self._redis = redis_client
         self._consumer_tasks = []
+        self._stream_buffer: List[Tuple[str, Dict[str, str]]] = []
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def publish(
         self,
@@ -221,19 +247,43 @@ class RedisEventBus(EventBus):
         
         stream_key = f"events:{topic}"
         
-        # Publish to Redis Stream
-        await self._redis.xadd(
+        # Queue for the next batched XADD flush
+        self._stream_buffer.append((
             stream_key,
             {
                 "type": event_type,
                 "data": json.dumps(data),
                 "metadata": json.dumps(metadata or {}),
                 "timestamp": event.timestamp.isoformat(),
-            }
-        )
+            },
+        ))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_soon())
         
         # Also publish to in-memory subscribers for local handlers
         await super().publish(topic, event_type, data, metadata)
+
+    async def _flush_soon(self) -> None:
+        """Wait one flush interval, then write everything buffered in one pipeline."""
+        try:
+            await asyncio.sleep(self.FLUSH_INTERVAL_SECONDS)
+        finally:
+            self._flush_task = None
+            await self._flush()
+
+    async def _flush(self) -> None:
+        batch, self._stream_buffer = self._stream_buffer, []
+        if not batch:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for stream_key, fields in batch:
+                    await pipe.xadd(
+                        stream_key, fields, maxlen=self.STREAM_MAXLEN, approximate=True
+                    )
+                await pipe.execute()
+        except Exception:
+            logger.exception("Failed to flush %d stream events", len(batch))
     
     async def start_consumer(self, topic: str, consumer_group: str = "default") -> None:
         """
@@ -273,7 +323,8 @@ class RedisEventBus(EventBus):
                             metadata = json.loads(message_data["metadata"])
                             
                             # Trigger local subscribers
-                            if topic in self._subscribers:
+                            subs = self._subscribers.get(topic, ())
+                            if subs:
                                 event = Event(
                                     type=event_type,
                                     topic=topic,
@@ -281,11 +332,11 @@ class RedisEventBus(EventBus):
                                     metadata=metadata,
                                 )
                                 
-                                for callback in self._subscribers[topic]:
+                                for callback in subs:
                                     try:
                                         await callback(event)
-                                    except Exception as e:
-                                        print(f"[EventBus] Error in handler: {e}")
+                                    except Exception:
+                                        logger.exception("Error in %s handler", topic)
                             
                             # Acknowledge message
                             await self._redis.xack(stream_key, consumer_group, message_id)
@@ -293,18 +344,20 @@ class RedisEventBus(EventBus):
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
-                    print(f"[EventBus] Consumer error: {e}")
+                    logger.warning("Consumer error on %s, retrying in 1 s: %s", stream_key, e)
                     await asyncio.sleep(1)
         
         task = asyncio.create_task(consume())
         self._consumer_tasks.append(task)
     
     async def shutdown(self) -> None:
-        """Stop all consumers."""
+        """Stop all consumers and flush any buffered events."""
         for task in self._consumer_tasks:
             task.cancel()
         
         await asyncio.gather(*self._consumer_tasks, return_exceptions=True)
+        await self._flush()
+        await super().shutdown()
 
 
 # Singleton instance for convenience
@@ -0,0 +1,97 @@
+"""
+Write-behind buffer in front of any IMistakeRepository.
+
+log_mistake only queues the row and returns, so the Postgres INSERT is off the
+request path. A single background writer collects whatever arrived within
+_FLUSH_INTERVAL_SECONDS (up to _BATCH_MAX_ROWS) and stores it with one
+log_mistakes call. Reads pass straight through; they may miss rows that are
+still buffered for up to one flush interval.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from domain.interfaces.IRepositories import IMistakeRepository
+from domain.models import GrammarMistake
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_INTERVAL_SECONDS = 0.1
+_BATCH_MAX_ROWS = 256
+_QUEUE_MAX_ROWS = 4096
+
+
+class BufferedMistakeRepository(IMistakeRepository):
+    def __init__(self, inner: IMistakeRepository):
+        self._inner = inner
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAX_ROWS)
+        self._writer: Optional[asyncio.Task] = None
+        self._dropped = 0
+
+    async def log_mistake(
+        self,
+        player_id: str,
+        category: str,
+        original: str,
+        correction: str,
+        explanation: str,
+        severity: int = 1,
+    ) -> None:
+        self._enqueue(GrammarMistake(
+            player_id=player_id,
+            category=category,
+            original=original,
+            correction=correction,
+            explanation=explanation,
+            severity=severity,
+        ))
+
+    async def log_mistakes(self, mistakes: List[GrammarMistake]) -> None:
+        for mistake in mistakes:
+            self._enqueue(mistake)
+
+    async def get_top_mistakes(
+        self, player_id: str, limit: int = 3
+    ) -> List[Dict[str, Any]]:
+        return await self._inner.get_top_mistakes(player_id, limit=limit)
+
+    async def get_recent_mistakes(
+        self, player_id: str, since_minutes: int = 15
+    ) -> List[Dict[str, Any]]:
+        return await self._inner.get_recent_mistakes(player_id, since_minutes=since_minutes)
+
+    async def shutdown(self) -> None:
+        """Write every buffered row, then stop the writer."""
+        if self._writer is None:
+            return
+        await self._queue.join()
+        self._writer.cancel()
+        await asyncio.gather(self._writer, return_exceptions=True)
+        self._writer = None
+
+    def _enqueue(self, mistake: GrammarMistake) -> None:
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_batches())
+        try:
+            self._queue.put_nowait(mistake)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            logger.warning(
+                "Mistake buffer full, dropped log for player %s (%d dropped so far)",
+                mistake.player_id, self._dropped,
+            )
+
+    async def _write_batches(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # Let the rest of this interval's rows arrive, then write them together
+            await asyncio.sleep(_FLUSH_INTERVAL_SECONDS)
+            while len(batch) < _BATCH_MAX_ROWS and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._inner.log_mistakes(batch)
+            except Exception:
+                logger.exception("Failed to write %d buffered mistakes", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
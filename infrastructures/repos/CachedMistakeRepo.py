@@ -0,0 +1,80 @@
+"""
+Read-through cache in front of any IMistakeRepository.
+
+The review scheduler and the /mistakes endpoint re-run the same aggregation
+queries several times per review window, while the underlying rows change
+slowly (one insert per mistake). Results are kept per player for up to 60 s
+and dropped as soon as that player logs a new mistake. A failed read is
+logged and answered with an empty list, but never cached.
+"""
+import logging
+from typing import Any, Dict, List, Tuple
+
+from cachetools import TTLCache
+
+from domain.interfaces.IRepositories import IMistakeRepository
+from domain.models import GrammarMistake
+
+logger = logging.getLogger(__name__)
+
+_CACHE_TTL_SECONDS = 60
+_CACHE_MAX_PLAYERS = 4096
+
+
+class CachedMistakeRepository(IMistakeRepository):
+    def __init__(self, inner: IMistakeRepository):
+        self._inner = inner
+        # player_id → {(query, arg): rows}; one entry per player so that
+        # log_mistake can invalidate everything for that player at once
+        self._cache: TTLCache = TTLCache(maxsize=_CACHE_MAX_PLAYERS, ttl=_CACHE_TTL_SECONDS)
+
+    async def log_mistake(
+        self,
+        player_id: str,
+        category: str,
+        original: str,
+        correction: str,
+        explanation: str,
+        severity: int = 1,
+    ) -> None:
+        await self._inner.log_mistake(
+            player_id, category, original, correction, explanation, severity
+        )
+        self._cache.pop(player_id, None)
+
+    async def log_mistakes(self, mistakes: List[GrammarMistake]) -> None:
+        await self._inner.log_mistakes(mistakes)
+        for mistake in mistakes:
+            self._cache.pop(mistake.player_id, None)
+
+    async def get_top_mistakes(
+        self, player_id: str, limit: int = 3
+    ) -> List[Dict[str, Any]]:
+        return await self._cached(player_id, ("top", limit))
+
+    async def get_recent_mistakes(
+        self, player_id: str, since_minutes: int = 15
+    ) -> List[Dict[str, Any]]:
+        return await self._cached(player_id, ("recent", since_minutes))
+
+    async def _cached(self, player_id: str, query: Tuple[str, int]) -> List[Dict[str, Any]]:
+        entries = self._cache.get(player_id)
+        if entries is None:
+            entries = self._cache[player_id] = {}
+        elif query in entries:
+            return entries[query]
+        kind, arg = query
+        try:
+            if kind == "top":
+                rows = await self._inner.get_top_mistakes(player_id, limit=arg)
+            else:
+                rows = await self._inner.get_recent_mistakes(player_id, since_minutes=arg)
+        except Exception as e:
+            # Same empty fallback as before, but a transient error must not
+            # hide the player's mistakes for a whole TTL window
+            logger.warning("Mistake query %s failed for player %s: %s", kind, player_id, e)
+            return []
+        # A log_mistake during the query replaced the player's entry; these rows may be stale
+        if self._cache.get(player_id) is entries:
+            entries[query] = rows
+        return rows
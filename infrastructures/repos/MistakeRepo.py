@@ -16,8 +16,13 @@ Table: grammar_mistakes
 from typing import Any, Dict, List
 
 from domain.interfaces.IRepositories import IMistakeRepository
+from domain.models import GrammarMistake
 from infrastructures.db import get_postgres_pool
 
+_COLUMNS = ("player_id", "category", "original", "correction", "explanation", "severity")
+# Below this many rows a pipelined INSERT beats COPY's extra column lookup
+_COPY_MIN_ROWS = 16
+
 
 class PostgresMistakeRepository(IMistakeRepository):
     async def _pool(self):
@@ -45,43 +50,62 @@ class PostgresMistakeRepository(IMistakeRepository):
             # For testing: silently fail if database is unavailable
             print(f"[MistakeRepo] Database error, skipping mistake log: {e}")
 
-    async def get_top_mistakes(
-        self, player_id: str, limit: int = 3
-    ) -> List[Dict[str, Any]]:
-        try:
-            pool = await self._pool()
-            rows = await pool.fetch(
+    async def log_mistakes(self, mistakes: List[GrammarMistake]) -> None:
+        # Unlike log_mistake, errors propagate: the write-behind buffer is the
+        # caller and logs a failed batch, and the cache must not treat it as landed
+        records = [
+            (m.player_id, m.category, m.original, m.correction, m.explanation, m.severity)
+            for m in mistakes
+        ]
+        pool = await self._pool()
+        if len(records) < _COPY_MIN_ROWS:
+            await pool.executemany(
                 """
-                SELECT category, COUNT(*) AS count
-                FROM grammar_mistakes
-                WHERE player_id = $1
-                GROUP BY category
-                ORDER BY count DESC
-                LIMIT $2
+                INSERT INTO grammar_mistakes (player_id, category, original, correction, explanation, severity)
+                VALUES ($1, $2, $3, $4, $5, $6)
                 """,
-                player_id, limit,
+                records,
             )
-            return [dict(row) for row in rows]
-        except Exception as e:
-            print(f"[MistakeRepo] Database error: {e}")
-            return []  # Return empty list if DB unavailable
+            return
+        async with pool.acquire() as conn:
+            # One transaction keeps COPY's column lookup and the copy itself
+            # on the same server connection behind PgBouncer
+            async with conn.transaction():
+                await conn.copy_records_to_table(
+                    "grammar_mistakes", records=records, columns=_COLUMNS,
+                )
+
+    async def get_top_mistakes(
+        self, player_id: str, limit: int = 3
+    ) -> List[Dict[str, Any]]:
+        # Errors propagate so CachedMistakeRepository can tell a failed read
+        # from an empty one and avoid caching it
+        pool = await self._pool()
+        rows = await pool.fetch(
+            """
+            SELECT category, COUNT(*) AS count
+            FROM grammar_mistakes
+            WHERE player_id = $1
+            GROUP BY category
+            ORDER BY count DESC
+            LIMIT $2
+            """,
+            player_id, limit,
+        )
+        return [dict(row) for row in rows]
 
     async def get_recent_mistakes(
         self, player_id: str, since_minutes: int = 15
     ) -> List[Dict[str, Any]]:
-        try:
-            pool = await self._pool()
-            rows = await pool.fetch(
-                """
-                SELECT id, category, original, correction, explanation, created_at
-                FROM grammar_mistakes
-                WHERE player_id = $1
-                  AND created_at >= now() - ($2 || ' minutes')::interval
-                ORDER BY created_at DESC
-                """,
-                player_id, str(since_minutes),
-            )
-            return [dict(row) for row in rows]
-        except Exception as e:
-            print(f"[MistakeRepo] Database error: {e}")
-            return []  # Return empty list if DB unavailable
+        pool = await self._pool()
+        rows = await pool.fetch(
+            """
+            SELECT id, category, original, correction, explanation, created_at
+            FROM grammar_mistakes
+            WHERE player_id = $1
+              AND created_at >= now() - make_interval(mins => $2)
+            ORDER BY created_at DESC
+            """,
+            player_id, since_minutes,
+        )
+        return [dict(row) for row in rows]
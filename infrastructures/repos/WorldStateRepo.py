@@ -6,10 +6,12 @@ is stored in Redis hashes and lists for O(1) reads during LLM prompt assembly.
 
 Key schema:
   player:state:{player_id}     → Redis HASH (player world state fields)
+  player:nearby:{player_id}    → Redis SET (npc_ids in proximity)
   player:conv:{player_id}:{npc_id} → Redis LIST (capped conversation history)
+  player:conv_fmt:{player_id}:{npc_id} → Redis LIST (same turns as "SPEAKER: content" lines)
 """
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from domain.interfaces.IRepositories import IWorldStateRepository
 from infrastructures.redis import get_redis_client
@@ -25,46 +27,87 @@ class RedisWorldStateRepository(IWorldStateRepository):
     def _state_key(self, player_id: str) -> str:
         return f"player:state:{player_id}"
 
+    def _nearby_key(self, player_id: str) -> str:
+        return f"player:nearby:{player_id}"
+
     def _conv_key(self, player_id: str, npc_id: str) -> str:
         return f"player:conv:{player_id}:{npc_id}"
 
-    async def get_player_state(self, player_id: str) -> Dict[str, Any]:
-        raw = await self._redis.hgetall(self._state_key(player_id))
+    def _conv_fmt_key(self, player_id: str, npc_id: str) -> str:
+        return f"player:conv_fmt:{player_id}:{npc_id}"
+
+    def _decode_state(
+        self, player_id: str, raw: Dict[str, Any], nearby: Set[str]
+    ) -> Dict[str, Any]:
         if not raw:
             # Return sensible defaults for a new player
-            return {
+            raw = {
                 "player_id": player_id,
                 "language": "en",
                 "proficiency_level": "B1",
                 "scene_id": "supermarket",
                 "object_in_hand": None,
-                "nearby_npcs": [],
                 "active_quest": None,
                 "active_npc_id": None,
             }
-        # Deserialize JSON-encoded list fields
-        for field_name in ("nearby_npcs",):
-            if field_name in raw:
-                raw[field_name] = json.loads(raw[field_name])
+        raw["nearby_npcs"] = sorted(nearby)
         return raw
 
+    async def get_player_state(self, player_id: str) -> Dict[str, Any]:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            await pipe.hgetall(self._state_key(player_id))
+            await pipe.smembers(self._nearby_key(player_id))
+            raw_state, nearby = await pipe.execute()
+        return self._decode_state(player_id, raw_state, nearby)
+
     async def update_player_state(self, player_id: str, patch: Dict[str, Any]) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            await self._queue_state_patch(pipe, player_id, patch)
+            await pipe.execute()
+
+    async def update_player_states_bulk(self, patches: Dict[str, Dict[str, Any]]) -> None:
+        # One non-transactional pipeline: a single round trip for every player
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for player_id, patch in patches.items():
+                await self._queue_state_patch(pipe, player_id, patch)
+            await pipe.execute()
+
+    async def _queue_state_patch(self, pipe, player_id: str, patch: Dict[str, Any]) -> None:
         key = self._state_key(player_id)
+        nearby_key = self._nearby_key(player_id)
         # Encode list values as JSON strings for Redis HASH storage
         serialized = {}
+        nearby = None
         for k, v in patch.items():
-            if isinstance(v, (list, dict)):
+            if k == "nearby_npcs":
+                nearby = v
+            elif isinstance(v, (list, dict)):
                 serialized[k] = json.dumps(v)
             elif v is None:
                 serialized[k] = ""
             else:
                 serialized[k] = str(v)
 
-        async with self._redis.pipeline(transaction=True) as pipe:
+        if serialized:
             await pipe.hset(key, mapping=serialized)
             await pipe.expire(key, _STATE_TTL_SECONDS)
+        if nearby is not None:
+            # A nearby_npcs value replaces the whole set
+            await pipe.delete(nearby_key)
+            if nearby:
+                await pipe.sadd(nearby_key, *nearby)
+                await pipe.expire(nearby_key, _STATE_TTL_SECONDS)
+
+    async def add_nearby_npc(self, player_id: str, npc_id: str) -> None:
+        key = self._nearby_key(player_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            await pipe.sadd(key, npc_id)
+            await pipe.expire(key, _STATE_TTL_SECONDS)
             await pipe.execute()
 
+    async def remove_nearby_npc(self, player_id: str, npc_id: str) -> None:
+        await self._redis.srem(self._nearby_key(player_id), npc_id)
+
     async def get_conversation_history(
         self, player_id: str, npc_id: str, window: int = 10
     ) -> List[Dict[str, str]]:
@@ -73,14 +116,36 @@ class RedisWorldStateRepository(IWorldStateRepository):
         raw_turns = await self._redis.lrange(key, -window, -1)
         return [json.loads(turn) for turn in raw_turns]
 
+    async def get_formatted_history(
+        self, player_id: str, npc_id: str, window: int = 10
+    ) -> List[str]:
+        return await self._redis.lrange(self._conv_fmt_key(player_id, npc_id), -window, -1)
+
+    async def get_turn_context(
+        self, player_id: str, npc_id: str, window: int = 10
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        # All reads go out in one non-transactional pipeline: one RTT
+        async with self._redis.pipeline(transaction=False) as pipe:
+            await pipe.hgetall(self._state_key(player_id))
+            await pipe.smembers(self._nearby_key(player_id))
+            await pipe.lrange(self._conv_fmt_key(player_id, npc_id), -window, -1)
+            raw_state, nearby, history_lines = await pipe.execute()
+        return self._decode_state(player_id, raw_state, nearby), history_lines
+
     async def append_conversation_turn(
-        self, player_id: str, npc_id: str, role: str, content: str
+        self, player_id: str, npc_id: str, role: str, content: str,
+        speaker: Optional[str] = None,
     ) -> None:
         key = self._conv_key(player_id, npc_id)
+        fmt_key = self._conv_fmt_key(player_id, npc_id)
         turn = json.dumps({"role": role, "content": content})
+        line = f"{speaker or role.upper()}: {content}"
         async with self._redis.pipeline(transaction=True) as pipe:
             await pipe.rpush(key, turn)
-            # Cap the list to avoid unbounded memory growth
+            await pipe.rpush(fmt_key, line)
+            # Cap the lists to avoid unbounded memory growth
             await pipe.ltrim(key, -_CONVERSATION_MAX_TURNS, -1)
+            await pipe.ltrim(fmt_key, -_CONVERSATION_MAX_TURNS, -1)
             await pipe.expire(key, _STATE_TTL_SECONDS)
+            await pipe.expire(fmt_key, _STATE_TTL_SECONDS)
             await pipe.execute()
@@ -4,20 +4,38 @@ load_dotenv()
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
+import logging
+import os
+import sys
 import time
+from contextlib import asynccontextmanager
 
-from _bootstrap.bootstrap import Container
+from _bootstrap.bootstrap import create_container
 from api.api import api_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pre-pay provider cold start before the first player turn (WARMUP=0 keeps
+    # services lazy, e.g. for REST-only workers)
+    if os.environ.get("WARMUP", "1") != "0":
+        await app.state.container.warm_up()
+    yield
+    # Finish in-flight grammar checks / state writes before the process exits
+    await app.state.container.shutdown()
+
+
 app = FastAPI(
     title="VirtuLingo",
     description="VirtuLingo — Real-time AI-powered Language Learning Backend",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# Build and attach the DI container once at startup
-container = Container()
-app.state.container = container
+# Attach the DI container (a process-wide singleton; services build lazily)
+app.state.container = create_container()
+
+# Per-turn pipeline tracing is DEBUG; keep it off the hot path in production
+logging.getLogger("application.DialogueOrchestrator").setLevel(logging.INFO)
 
 
 # Debug middleware to log all requests
@@ -61,3 +79,15 @@ app.include_router(api_router)
 @app.get("/health")
 def healthcheck():
     return {"status": "ok", "service": "virtulingo-backend"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop (libuv-backed reactor) is not available on Windows
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+    )